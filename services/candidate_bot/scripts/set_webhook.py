@@ -4,18 +4,43 @@
 Run this once after deployment to register webhook URL with Telegram.
 
 Usage:
-    python set_webhook.py
+    python set_webhook.py [--verify]
 
 Environment variables required:
     TELEGRAM_BOT_TOKEN_CANDIDATE - Bot token from @BotFather
     WEBHOOK_SECRET_CANDIDATE - Secret for webhook URL
     WEBHOOK_DOMAIN - Domain (e.g., dev.x5teamintern.ru)
+
+Optional:
+    WEBHOOK_VERIFY=1 (or --verify) - Print getWebhookInfo after setting
 """
 
 import os
 import sys
+import time
+
 import requests
 
+# Telegram sometimes drops the first connection, retry a few times
+MAX_ATTEMPTS = 3
+REQUEST_TIMEOUT = 5
+
+# Shared session: both calls go to api.telegram.org over one connection
+session = requests.Session()
+
+
+def request_with_retry(method: str, url: str, **kwargs) -> requests.Response:
+    """Send HTTP request, retrying timeouts and connection errors with backoff."""
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            return session.request(method, url, timeout=REQUEST_TIMEOUT, **kwargs)
+        except (requests.Timeout, requests.ConnectionError) as e:
+            if attempt == MAX_ATTEMPTS - 1:
+                raise
+            delay = 2 ** attempt
+            print(f"⚠️ {e.__class__.__name__}, retrying in {delay}s...")
+            time.sleep(delay)
+
 
 def main():
     # Get config from env
@@ -39,7 +64,7 @@ def main():
     # Call Telegram API
     api_url = f"https://api.telegram.org/bot{token}/setWebhook"
     
-    response = requests.post(api_url, json={
+    response = request_with_retry("POST", api_url, json={
         "url": webhook_url,
         "allowed_updates": ["message", "callback_query"],
         "drop_pending_updates": True,  # Ignore old messages
@@ -54,9 +79,13 @@ def main():
         print(f"❌ Failed to set webhook: {result}")
         sys.exit(1)
     
-    # Verify webhook
+    # Verify webhook (extra round trip, only on request)
+    if not (os.getenv("WEBHOOK_VERIFY") == "1" or "--verify" in sys.argv):
+        print("   Run with WEBHOOK_VERIFY=1 or --verify to see webhook info")
+        return
+    
     info_url = f"https://api.telegram.org/bot{token}/getWebhookInfo"
-    info = requests.get(info_url).json()
+    info = request_with_retry("GET", info_url).json()
     
     if info.get("ok"):
         webhook_info = info.get("result", {})
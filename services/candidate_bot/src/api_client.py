@@ -1,22 +1,98 @@
 """HTTP client for core_api."""
 
+import asyncio
 import logging
+import time
 from typing import Any
 
 import aiohttp
+import orjson
 
 from src.config import config
 
 logger = logging.getLogger(__name__)
 
+# Default timeout for all core_api requests
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=5, sock_read=25)
+
+# Tracks change rarely, cache them in process
+TRACKS_CACHE_TTL = 60.0
+
+# Repeated /start lookups for the same user are served from memory
+CANDIDATE_CACHE_TTL = 30.0
+# "Not registered" is kept much shorter: create_candidate() only clears
+# this pod's cache, other replicas may keep a stale miss until it expires
+CANDIDATE_NOT_FOUND_TTL = 5.0
+CANDIDATE_CACHE_MAX_SIZE = 4096
+
+
+# Endpoints without path parameters, full URLs are built once per client
+FIXED_ENDPOINTS = (
+    "/api/candidates/",
+    "/api/quiz/start",
+    "/api/quiz/answer",
+    "/api/quiz/attempts",
+    "/api/tracks/",
+)
+
+
+class ApiError(Exception):
+    """core_api request failed (error status, network error, bad body)."""
+
 
 class ApiClient:
     """Async HTTP client for core_api."""
     
     def __init__(self, base_url: str | None = None):
         self.base_url = (base_url or config.api_base_url).rstrip("/")
+        self._fixed_urls = {
+            endpoint: f"{self.base_url}/{endpoint.lstrip('/')}"
+            for endpoint in FIXED_ENDPOINTS
+        }
+        self._session: aiohttp.ClientSession | None = None
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        # Strong refs to background prefetches
+        self._prefetch_tasks: set[asyncio.Task] = set()
+        self._tracks_cache: dict[bool, tuple[float, list[dict]]] = {}
+        # telegram_id -> (expires at, candidate or None if not registered)
+        self._candidate_cache: dict[int, tuple[float, dict | None]] = {}
+        # (source tracks list, names, names set, name -> track) derived from tracks cache
+        self._track_names: tuple[list[dict] | None, list[str], frozenset[str], dict[str, dict]] = (
+            None, [], frozenset(), {},
+        )
     
-    async def _request(
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get shared HTTP session, creating it on first use.
+        
+        Created lazily because aiohttp needs a running event loop.
+        """
+        if self._session is None or self._session.closed:
+            # core_api is a single host, so limit_per_host is the real cap
+            connector = aiohttp.TCPConnector(
+                limit=200,
+                limit_per_host=64,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=DEFAULT_TIMEOUT,
+                json_serialize=lambda obj: orjson.dumps(obj).decode(),
+            )
+        return self._session
+    
+    async def open(self) -> None:
+        """Create shared HTTP session up front (e.g. on app startup)."""
+        await self._get_session()
+    
+    async def close(self) -> None:
+        """Close shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def _send(
         self,
         method: str,
         endpoint: str,
@@ -32,38 +108,78 @@ class ApiClient:
             params: Query parameters
             
         Returns:
-            Response JSON or None on error.
+            Response JSON, or None if empty or not found (404).
+            
+        Raises:
+            ApiError: On any other failure.
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        url = self._fixed_urls.get(endpoint) or f"{self.base_url}/{endpoint.lstrip('/')}"
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.request(
-                    method,
-                    url,
-                    json=data,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=30),
-                ) as response:
-                    if response.status in (200, 201):
-                        return await response.json()
-                    elif response.status == 404:
-                        logger.debug(f"Not found: {url}")
-                        return None
-                    else:
-                        text = await response.text()
-                        logger.error(f"API Error {response.status} {url}: {text}")
-                        return None
+            session = await self._get_session()
+            async with session.request(
+                method,
+                url,
+                json=data,
+                params=params,
+            ) as response:
+                status = response.status
+                if 200 <= status < 300:
+                    body = await response.read()
+                    return orjson.loads(body) if body else None
+                if status == 404:
+                    logger.debug("Not found: %s", url)
+                    return None
+                text = await response.text()
+                logger.error("API Error %s %s: %s", status, url, text)
+                raise ApiError(f"{status} {url}")
+        except ApiError:
+            raise
         except aiohttp.ClientError as e:
-            logger.error(f"Request failed: {e}")
-            return None
+            logger.error("Request failed: %s", e)
+            raise ApiError(str(e)) from e
         except Exception as e:
-            logger.exception(f"Unexpected error: {e}")
+            logger.exception("Unexpected error")
+            raise ApiError(str(e)) from e
+    
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict | None = None,
+        params: dict | None = None,
+    ) -> dict | None:
+        """Make HTTP request to API.
+        
+        Returns:
+            Response JSON or None on error.
+        """
+        try:
+            return await self._send(method, endpoint, data=data, params=params)
+        except ApiError:
             return None
     
-    async def get(self, endpoint: str, params: dict | None = None) -> dict | None:
-        """GET request."""
-        return await self._request("GET", endpoint, params=params)
+    async def get(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        raise_errors: bool = False,
+    ) -> dict | None:
+        """GET request.
+        
+        Concurrent identical GETs share a single in-flight request.
+        With raise_errors, failures raise ApiError instead of returning
+        None, so None means "not found".
+        """
+        key = (endpoint, tuple(sorted(params.items())) if params else (), raise_errors)
+        task = self._inflight.get(key)
+        if task is None:
+            request = self._send if raise_errors else self._request
+            task = asyncio.create_task(request("GET", endpoint, params=params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one cancelled caller doesn't cancel the shared request
+        return await asyncio.shield(task)
     
     async def post(self, endpoint: str, data: dict) -> dict | None:
         """POST request."""
@@ -84,10 +200,14 @@ class ApiClient:
         Returns:
             Created candidate with `id` (UUID) or None.
         """
-        return await self.post("/api/candidates/", candidate_data)
+        result = await self.post("/api/candidates/", candidate_data)
+        telegram_id = candidate_data.get("telegram_id")
+        if telegram_id is not None:
+            self.invalidate_candidate_cache(telegram_id)
+        return result
     
     async def get_candidate_by_telegram_id(self, telegram_id: int) -> dict | None:
-        """Get candidate by telegram ID.
+        """Get candidate by telegram ID (cached, see CANDIDATE_CACHE_TTL).
         
         GET /api/candidates/telegram/{telegram_id}
         
@@ -95,9 +215,33 @@ class ApiClient:
             telegram_id: Telegram user ID.
             
         Returns:
-            Candidate data with `id` (UUID) or None if not found.
+            Candidate data with `id` (UUID) or None if not found or on error.
         """
-        return await self.get(f"/api/candidates/telegram/{telegram_id}")
+        cached = self._candidate_cache.get(telegram_id)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+        
+        try:
+            result = await self.get(
+                f"/api/candidates/telegram/{telegram_id}", raise_errors=True,
+            )
+        except ApiError:
+            # Don't cache failures as "not registered"
+            return None
+        
+        now = time.monotonic()
+        if len(self._candidate_cache) >= CANDIDATE_CACHE_MAX_SIZE:
+            self._candidate_cache = {
+                k: v for k, v in self._candidate_cache.items() if now < v[0]
+            }
+        # A real 404 is cached too, but only for CANDIDATE_NOT_FOUND_TTL
+        ttl = CANDIDATE_CACHE_TTL if result is not None else CANDIDATE_NOT_FOUND_TTL
+        self._candidate_cache[telegram_id] = (now + ttl, result)
+        return result
+    
+    def invalidate_candidate_cache(self, telegram_id: int) -> None:
+        """Drop cached candidate so the next lookup hits the API."""
+        self._candidate_cache.pop(telegram_id, None)
     
     # =========================================================================
     # Quiz API
@@ -168,14 +312,16 @@ class ApiClient:
         self,
         candidate_id: str,
         track_id: int | None = None,
+        limit: int | None = None,
     ) -> dict | None:
-        """Get quiz attempts for candidate.
+        """Get quiz attempts for candidate, newest first.
         
-        GET /api/quiz/attempts?candidate_id=xxx&track_id=yyy
+        GET /api/quiz/attempts?candidate_id=xxx&track_id=yyy&limit=n
         
         Args:
             candidate_id: Candidate UUID.
             track_id: Optional track filter.
+            limit: Optional max number of attempts (1 = latest only).
             
         Returns:
             {"attempts": [...]}
@@ -183,6 +329,8 @@ class ApiClient:
         params = {"candidate_id": candidate_id}
         if track_id:
             params["track_id"] = track_id
+        if limit:
+            params["limit"] = limit
         return await self.get("/api/quiz/attempts", params=params)
     
     # =========================================================================
@@ -190,7 +338,7 @@ class ApiClient:
     # =========================================================================
     
     async def get_tracks(self, active_only: bool = True) -> list[dict] | None:
-        """Get available tracks.
+        """Get available tracks (cached for TRACKS_CACHE_TTL seconds).
         
         GET /api/tracks/?active_only=true
         
@@ -200,9 +348,76 @@ class ApiClient:
         Returns:
             List of tracks: [{id: int, name: str, description: str, is_active: bool}, ...]
         """
+        cached = self._tracks_cache.get(active_only)
+        if cached and time.monotonic() - cached[0] < TRACKS_CACHE_TTL:
+            return cached[1]
+        
+        # Concurrent misses share one request via get() single-flight
         params = {"active_only": str(active_only).lower()}
         result = await self.get("/api/tracks/", params=params)
-        return result if isinstance(result, list) else None
+        if not isinstance(result, list):
+            return None
+        
+        if result:
+            self._tracks_cache[active_only] = (time.monotonic(), result)
+        return result
+    
+    async def _get_track_names_cache(
+        self,
+    ) -> tuple[list[dict] | None, list[str], frozenset[str], dict[str, dict]]:
+        """Get track names and lookups derived from active tracks.
+        
+        Rebuilt only when the cached tracks list is refreshed.
+        """
+        tracks = await self.get_tracks(active_only=True)
+        if not tracks:
+            return (None, [], frozenset(), {})
+        if self._track_names[0] is not tracks:
+            names = [t.get("name", "") for t in tracks if t.get("name")]
+            by_name = {t["name"]: t for t in reversed(tracks) if t.get("name")}
+            self._track_names = (tracks, names, frozenset(names), by_name)
+        return self._track_names
+    
+    async def get_track_names(self) -> list[str]:
+        """Get names of active tracks.
+        
+        Returns:
+            List of track names (empty if API unavailable).
+        """
+        return (await self._get_track_names_cache())[1]
+    
+    async def get_track_name_set(self) -> frozenset[str]:
+        """Get names of active tracks as a set for validation.
+        
+        Returns:
+            Set of track names (empty if API unavailable).
+        """
+        return (await self._get_track_names_cache())[2]
+    
+    async def get_active_track_by_name(self, name: str | None) -> dict | None:
+        """Find active track by name.
+        
+        Returns:
+            Track data or None if not found or API unavailable.
+        """
+        return (await self._get_track_names_cache())[3].get(name)
+    
+    def prefetch_tracks(self) -> None:
+        """Warm active tracks cache in background (no-op if still fresh).
+        
+        Called a step before tracks are needed, so the fetch overlaps
+        with the user typing the answer.
+        """
+        cached = self._tracks_cache.get(True)
+        if cached and time.monotonic() - cached[0] < TRACKS_CACHE_TTL:
+            return
+        task = asyncio.create_task(self.get_track_names())
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._prefetch_tasks.discard)
+    
+    def invalidate_tracks_cache(self) -> None:
+        """Drop cached tracks so the next get_tracks() hits the API."""
+        self._tracks_cache.clear()
     
     async def get_track_by_id(self, track_id: int) -> dict | None:
         """Get track by ID.
@@ -5,9 +5,12 @@ import logging
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
-from aiogram.fsm.storage.memory import MemoryStorage
 
+from src.api_client import api_client
 from src.config import config
+from src.message_utils import TrackingMiddleware
+from src.storage import FSMDataCacheMiddleware, create_storage
+from src.throttling import ThrottlingRequestMiddleware
 
 logger = logging.getLogger(__name__)
 
@@ -16,15 +19,26 @@ bot = Bot(
     token=config.bot_token,
     default=DefaultBotProperties(parse_mode=ParseMode.MARKDOWN),
 )
+# Smooth outgoing sends under Telegram flood limits, retry on 429
+bot.session.middleware(ThrottlingRequestMiddleware())
 
-# Dispatcher with memory storage (stateless for k8s, state in FSM per user)
-dp = Dispatcher(storage=MemoryStorage())
+# Dispatcher with FSM storage (Redis if configured, else memory).
+# Event isolation keeps updates of one user sequential while webhook
+# updates are processed concurrently in background.
+storage, events_isolation = create_storage()
+dp = Dispatcher(storage=storage, events_isolation=events_isolation)
+# Registered after the built-in FSM middleware, so both run inside its lock.
+# Tracking writes finish before the cached FSM data is flushed.
+dp.update.outer_middleware(FSMDataCacheMiddleware())
+dp.update.outer_middleware(TrackingMiddleware())
 
 
 def setup_handlers() -> None:
-    """Register all handlers."""
-    from src.handlers import start, form, resume, quiz, edit
-    from src.handlers.summary import router as summary_router
+    """Register all handlers (once per dispatcher)."""
+    if dp.sub_routers:
+        return
+    
+    from src.handlers import edit, form, quiz, resume, start, summary_router
     
     # Include routers (order matters for handler priority)
     dp.include_router(start.router)
@@ -34,5 +48,8 @@ def setup_handlers() -> None:
     dp.include_router(quiz.router)
     dp.include_router(edit.router)
     
+    # Close shared API session on polling shutdown
+    dp.shutdown.register(api_client.close)
+    
     logger.info("Handlers registered")
 
@@ -17,6 +17,9 @@ class Config:
     # API
     api_base_url: str
     
+    # FSM storage (empty = in-memory)
+    redis_url: str
+    
     # App
     environment: str
     log_level: str
@@ -24,14 +27,16 @@ class Config:
     @classmethod
     def from_env(cls) -> "Config":
         """Load config from environment variables."""
+        env = os.environ
         return cls(
-            bot_token=os.getenv("TELEGRAM_BOT_TOKEN_CANDIDATE") or os.getenv("TELEGRAM_BOT_TOKEN", ""),
-            webhook_secret=os.getenv("WEBHOOK_SECRET_CANDIDATE") or os.getenv("WEBHOOK_SECRET", ""),
-            webhook_path=os.getenv("WEBHOOK_PATH", "/tg/candidate"),
-            webhook_base_url=os.getenv("WEBHOOK_BASE_URL", ""),  # Required for webhook registration
-            api_base_url=os.getenv("API_BASE_URL", "http://core-api:8000"),
-            environment=os.getenv("ENVIRONMENT", "dev"),
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
+            bot_token=env.get("TELEGRAM_BOT_TOKEN_CANDIDATE") or env.get("TELEGRAM_BOT_TOKEN", ""),
+            webhook_secret=env.get("WEBHOOK_SECRET_CANDIDATE") or env.get("WEBHOOK_SECRET", ""),
+            webhook_path=env.get("WEBHOOK_PATH", "/tg/candidate"),
+            webhook_base_url=env.get("WEBHOOK_BASE_URL", ""),  # Required for webhook registration
+            api_base_url=env.get("API_BASE_URL", "http://core-api:8000"),
+            redis_url=env.get("REDIS_URL", ""),
+            environment=env.get("ENVIRONMENT", "dev"),
+            log_level=env.get("LOG_LEVEL", "INFO"),
         )
     
     @property
@@ -1,7 +1,5 @@
 """Load data from text files."""
 
-import os
-from functools import lru_cache
 from pathlib import Path
 
 # Data directory path
@@ -17,27 +15,25 @@ def read_lines(filename: str) -> list[str]:
     Returns:
         List of non-empty lines.
     """
-    filepath = DATA_DIR / filename
-    if not filepath.exists():
+    try:
+        data = (DATA_DIR / filename).read_bytes()
+    except FileNotFoundError:
         return []
     
-    with open(filepath, "r", encoding="utf-8") as f:
-        return [line.strip() for line in f if line.strip()]
+    lines = (line.strip() for line in data.decode("utf-8").splitlines())
+    return [line for line in lines if line]
 
 
-@lru_cache(maxsize=1)
 def get_courses() -> list[str]:
     """Get course options."""
     return read_lines("courses.txt")
 
 
-@lru_cache(maxsize=1)
 def get_sources() -> list[str]:
     """Get source options."""
     return read_lines("sources.txt")
 
 
-@lru_cache(maxsize=1)
 def get_universities() -> list[str]:
     """Get university options."""
     return read_lines("universities.txt")
@@ -46,5 +42,6 @@ def get_universities() -> list[str]:
 # Pre-load data on import
 COURSES = get_courses()
 SOURCES = get_sources()
-UNIVERSITIES = get_universities()
+# Immutable, so the parser can cache lookups derived from it
+UNIVERSITIES = tuple(get_universities())
 
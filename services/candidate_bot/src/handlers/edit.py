@@ -1,94 +1,104 @@
 """Edit field callback handlers."""
 
 import logging
+from typing import NamedTuple
 
 from aiogram import Router, types, F
 from aiogram.fsm.context import FSMContext
+from aiogram.fsm.state import State
+from aiogram.types import ReplyKeyboardMarkup, ReplyKeyboardRemove
 
 from src.states import InternForm
-from src.keyboards import make_keyboard, REMOVE_KEYBOARD
-from src.data_loader import COURSES, UNIVERSITIES
+from src.keyboards import (
+    make_tracks_keyboard,
+    REMOVE_KEYBOARD,
+    PHONE_KEYBOARD,
+    COURSES_KEYBOARD,
+    UNIVERSITIES_KEYBOARD,
+    EMPLOYMENT_HOURS_KEYBOARD,
+    CITY_KEYBOARD,
+    CITIZENSHIP_KEYBOARD,
+)
 from src.api_client import api_client
 from src.message_utils import track_bot_message
 
 logger = logging.getLogger(__name__)
 router = Router()
 
+# Checked once per callback for the whole router, not per field handler
+router.callback_query.filter(F.data.startswith("edit_"), InternForm.confirm)
+
+
+class FieldConfig(NamedTuple):
+    """Edit config for one form field."""
+    
+    state: State
+    prompt: str
+    keyboard: ReplyKeyboardMarkup | str | None  # "tracks" = async, needs API
+
 
-# Field configuration: state, prompt, keyboard (None = async, needs API)
 FIELD_CONFIG = {
-    "surname": (InternForm.surname, "Введи новую фамилию:", None),
-    "name": (InternForm.name, "Введи новое имя:", None),
-    "phone": (
-        InternForm.phone,
-        "Отправь номер телефона (кнопка):",
-        lambda: make_keyboard([], request_contact=True),
-    ),
-    "email": (InternForm.email, "Введи новый email:", None),
-    "resume_link": (InternForm.resume_link, "Введи ссылку на резюме:", None),
-    "priority1": (InternForm.priority1, "Выбери первый приоритет:", "tracks"),
-    "priority2": (InternForm.priority2, "Выбери второй приоритет:", "tracks"),
-    "course": (
-        InternForm.course,
-        "Укажи ступень обучения:",
-        lambda: make_keyboard(COURSES, add_other=True),
-    ),
-    "university": (
-        InternForm.university,
-        "Выбери ВУЗ:",
-        lambda: make_keyboard(UNIVERSITIES, add_other=True),
-    ),
-    "specialty": (InternForm.specialty, "Укажи специальность:", None),
-    "employment_hours": (
+    "surname": FieldConfig(InternForm.surname, "Введи новую фамилию:", None),
+    "name": FieldConfig(InternForm.name, "Введи новое имя:", None),
+    "phone": FieldConfig(InternForm.phone, "Отправь номер телефона (кнопка):", PHONE_KEYBOARD),
+    "email": FieldConfig(InternForm.email, "Введи новый email:", None),
+    "resume_link": FieldConfig(InternForm.resume_link, "Введи ссылку на резюме:", None),
+    "priority1": FieldConfig(InternForm.priority1, "Выбери первый приоритет:", "tracks"),
+    "priority2": FieldConfig(InternForm.priority2, "Выбери второй приоритет:", "tracks"),
+    "course": FieldConfig(InternForm.course, "Укажи ступень обучения:", COURSES_KEYBOARD),
+    "university": FieldConfig(InternForm.university, "Выбери ВУЗ:", UNIVERSITIES_KEYBOARD),
+    "specialty": FieldConfig(InternForm.specialty, "Укажи специальность:", None),
+    "employment_hours": FieldConfig(
         InternForm.employment_hours,
         "Выбери занятость:",
-        lambda: make_keyboard(["20", "30", "40"], row_width=3),
-    ),
-    "city": (
-        InternForm.city,
-        "Укажи город:",
-        lambda: make_keyboard(["Москва", "Санкт-Петербург", "Казань"], add_other=True),
-    ),
-    "birth_year": (InternForm.birth_year, "Укажи год рождения:", None),
-    "citizenship": (
-        InternForm.citizenship,
-        "Укажи гражданство:",
-        lambda: make_keyboard(["РФ"], add_other=True),
+        EMPLOYMENT_HOURS_KEYBOARD,
     ),
-    "tech_stack": (InternForm.tech_stack, "Введи стек технологий:", None),
+    "city": FieldConfig(InternForm.city, "Укажи город:", CITY_KEYBOARD),
+    "birth_year": FieldConfig(InternForm.birth_year, "Укажи год рождения:", None),
+    "citizenship": FieldConfig(InternForm.citizenship, "Укажи гражданство:", CITIZENSHIP_KEYBOARD),
+    "tech_stack": FieldConfig(InternForm.tech_stack, "Введи стек технологий:", None),
 }
 
 
-@router.callback_query(F.data.startswith("edit_"), InternForm.confirm)
-async def edit_field(callback: types.CallbackQuery, state: FSMContext) -> None:
-    """Handle edit button click."""
-    field = callback.data.removeprefix("edit_")
-    
-    if field not in FIELD_CONFIG:
-        await callback.answer("Неизвестное поле")
-        return
-    
-    target_state, prompt, keyboard_source = FIELD_CONFIG[field]
-    
-    # Mark as editing mode
-    await state.update_data(is_editing=True)
-    await state.set_state(target_state)
+async def get_tracks_keyboard() -> ReplyKeyboardMarkup | ReplyKeyboardRemove:
+    """Build tracks keyboard from cached track names."""
+    track_names = await api_client.get_track_names()
+    if not track_names:
+        return REMOVE_KEYBOARD
+    return make_tracks_keyboard(track_names)
+
+
+def make_edit_handler(field: FieldConfig):
+    """Build edit button handler bound to one field's config."""
     
-    # Get keyboard
-    if keyboard_source == "tracks":
-        tracks = await api_client.get_tracks(active_only=True)
-        if tracks:
-            track_names = [t.get("name", "") for t in tracks if t.get("name")]
-            await state.update_data(available_tracks=track_names)
-            keyboard = make_keyboard(track_names)
+    async def edit_field(callback: types.CallbackQuery, state: FSMContext) -> None:
+        """Handle edit button click."""
+        # Mark as editing mode (already set when editing field after field)
+        data = await state.get_data()
+        if not data.get("is_editing"):
+            data["is_editing"] = True
+            await state.set_data(data)
+        await state.set_state(field.state)
+        
+        # Get keyboard
+        if field.keyboard == "tracks":
+            keyboard = await get_tracks_keyboard()
         else:
-            keyboard = REMOVE_KEYBOARD
-    elif callable(keyboard_source):
-        keyboard = keyboard_source()
-    else:
-        keyboard = REMOVE_KEYBOARD
+            keyboard = field.keyboard or REMOVE_KEYBOARD
+        
+        sent = await callback.message.answer(field.prompt, reply_markup=keyboard)
+        await track_bot_message(sent, state)
+        await callback.answer()
     
-    sent = await callback.message.answer(prompt, reply_markup=keyboard)
-    await track_bot_message(sent, state)
-    await callback.answer()
+    return edit_field
+
+
+# One handler per field: router filters do the dispatch
+for _name, _field in FIELD_CONFIG.items():
+    router.callback_query.register(make_edit_handler(_field), F.data == f"edit_{_name}")
+
 
+@router.callback_query()
+async def edit_unknown_field(callback: types.CallbackQuery) -> None:
+    """Handle edit button for unknown field."""
+    await callback.answer("Неизвестное поле")
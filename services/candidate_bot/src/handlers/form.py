@@ -1,73 +1,97 @@
 """Form field handlers - classic chat style with message tracking."""
 
-import logging
+import re
+from collections.abc import Awaitable, Callable
+from typing import NamedTuple
 
 from aiogram import Router, types
 from aiogram.fsm.context import FSMContext
+from aiogram.fsm.state import State
 
-from src.keyboards import make_keyboard, REMOVE_KEYBOARD
-from src.states import InternForm
-from src.data_loader import COURSES, UNIVERSITIES, SOURCES
 from src.api_client import api_client
 from src.handlers.summary import show_summary
-from src.message_utils import track_bot_message, track_user_message
+from src.keyboards import (
+    CITIZENSHIP_KEYBOARD,
+    CITY_KEYBOARD,
+    COURSES_KEYBOARD,
+    EMPLOYMENT_HOURS_KEYBOARD,
+    PHONE_KEYBOARD,
+    REMOVE_KEYBOARD,
+    SOURCES_KEYBOARD,
+    UNIVERSITIES_KEYBOARD,
+    VALID_EMPLOYMENT_HOURS,
+    make_tracks_keyboard,
+)
+from src.message_utils import track_in_background, track_user_message
+from src.states import InternForm
 
-logger = logging.getLogger(__name__)
 router = Router()
 
+FormHandler = Callable[[types.Message, FSMContext], Awaitable[None]]
+
+# Raw state -> handler. One dict lookup routes form messages instead of
+# checking a StateFilter per registered handler.
+FORM_HANDLERS: dict[str, FormHandler] = {}
+
+
+def form_step(form_state: State) -> Callable[[FormHandler], FormHandler]:
+    """Register handler for a form state in FORM_HANDLERS."""
+    def decorator(handler: FormHandler) -> FormHandler:
+        FORM_HANDLERS[form_state.state] = handler
+        return handler
+    return decorator
+
+# local@domain.tld without whitespace; bounded parts keep matching cheap
+EMAIL_RE = re.compile(r"[^\s@]{1,64}@[^\s@]{1,255}\.[^\s@.]{2,}")
+
 
 async def send_and_track(message: types.Message, state: FSMContext, text: str, **kwargs) -> types.Message:
     """Send message and track both user input and bot response."""
-    await track_user_message(message, state)
     sent = await message.answer(text, **kwargs)
-    await track_bot_message(sent, state)
+    track_in_background(state, message.message_id, sent.message_id)
     return sent
 
 
-async def get_track_names() -> list[str]:
-    """Get track names from API."""
-    tracks = await api_client.get_tracks(active_only=True)
-    if tracks:
-        return [t.get("name", "") for t in tracks if t.get("name")]
-    return []
-
-
-# === Basic Info ===
-
-@router.message(InternForm.surname)
-async def process_surname(message: types.Message, state: FSMContext) -> None:
-    """Handle surname input."""
-    await state.update_data(surname=message.text)
-    
+async def save_and_continue(
+    message: types.Message,
+    state: FSMContext,
+    field: str,
+    value: str,
+    next_step: FormHandler,
+) -> None:
+    """Store field value, then show summary when editing or ask next step."""
     data = await state.get_data()
+    # Skip the write if the value is unchanged
+    if data.get(field) != value:
+        data[field] = value
+        await state.set_data(data)
+    
     if data.get("is_editing"):
         await show_summary(message, state)
         return
     
+    await next_step(message, state)
+
+
+# === Basic Info ===
+
+async def ask_name(message: types.Message, state: FSMContext) -> None:
+    """Ask for name."""
     await send_and_track(message, state, "Введи своё **Имя**:")
     await state.set_state(InternForm.name)
 
 
-@router.message(InternForm.name)
-async def process_name(message: types.Message, state: FSMContext) -> None:
-    """Handle name input."""
-    await state.update_data(name=message.text)
-    
-    data = await state.get_data()
-    if data.get("is_editing"):
-        await show_summary(message, state)
-        return
-    
-    kb = make_keyboard([], request_contact=True)
+async def ask_phone(message: types.Message, state: FSMContext) -> None:
+    """Ask for phone via contact button."""
     await send_and_track(
         message, state,
         "Нажми кнопку, чтобы отправить **номер телефона** 📱",
-        reply_markup=kb,
+        reply_markup=PHONE_KEYBOARD,
     )
     await state.set_state(InternForm.phone)
 
 
-@router.message(InternForm.phone)
+@form_step(InternForm.phone)
 async def process_phone(message: types.Message, state: FSMContext) -> None:
     """Handle phone input (contact sharing only)."""
     if not message.contact:
@@ -86,51 +110,36 @@ async def process_phone(message: types.Message, state: FSMContext) -> None:
         await send_and_track(message, state, "Некорректный номер. Попробуй ещё раз.")
         return
     
-    await state.update_data(phone=phone)
-    
-    data = await state.get_data()
-    if data.get("is_editing"):
-        await show_summary(message, state)
-        return
-    
+    await save_and_continue(message, state, "phone", phone, ask_email)
+
+
+async def ask_email(message: types.Message, state: FSMContext) -> None:
+    """Ask for email."""
     await send_and_track(message, state, "Введи свою **почту** 📧", reply_markup=REMOVE_KEYBOARD)
     await state.set_state(InternForm.email)
 
 
-@router.message(InternForm.email)
+@form_step(InternForm.email)
 async def process_email(message: types.Message, state: FSMContext) -> None:
     """Handle email input."""
-    if "@" not in message.text:
+    if not message.text or not EMAIL_RE.fullmatch(message.text):
         await send_and_track(message, state, "Пожалуйста, введи корректный email.")
         return
     
-    await state.update_data(email=message.text)
-    
-    data = await state.get_data()
-    if data.get("is_editing"):
-        await show_summary(message, state)
-        return
-    
-    await send_and_track(message, state, "Вставь **ссылку на резюме** (или напиши 'нет') 📄")
-    await state.set_state(InternForm.resume_link)
+    await save_and_continue(message, state, "email", message.text, ask_resume_link)
 
 
-@router.message(InternForm.resume_link)
-async def process_resume_link(message: types.Message, state: FSMContext) -> None:
-    """Handle resume link input."""
-    await state.update_data(resume_link=message.text)
-    
-    data = await state.get_data()
-    if data.get("is_editing"):
-        await show_summary(message, state)
-        return
-    
-    await ask_priority1(message, state)
+async def ask_resume_link(message: types.Message, state: FSMContext) -> None:
+    """Ask for resume link."""
+    # Next step needs tracks; load them while the user answers
+    api_client.prefetch_tracks()
+    await send_and_track(message, state, "Вставь **ссылку на резюме** (или напиши 'нет') 📄")
+    await state.set_state(InternForm.resume_link)
 
 
 async def ask_priority1(message: types.Message, state: FSMContext) -> None:
     """Ask for priority 1 with tracks from API."""
-    tracks = await get_track_names()
+    tracks = await api_client.get_track_names()
     if not tracks:
         await send_and_track(
             message, state,
@@ -138,44 +147,28 @@ async def ask_priority1(message: types.Message, state: FSMContext) -> None:
             reply_markup=REMOVE_KEYBOARD,
         )
     else:
-        await state.update_data(available_tracks=tracks)
-        kb = make_keyboard(tracks)
+        kb = make_tracks_keyboard(tracks)
         await send_and_track(message, state, "Выбери **первый приоритет** (направление) 🎯", reply_markup=kb)
     await state.set_state(InternForm.priority1)
 
 
-@router.message(InternForm.priority1)
+@form_step(InternForm.priority1)
 async def process_priority1(message: types.Message, state: FSMContext) -> None:
     """Handle priority 1 selection."""
-    data = await state.get_data()
-    tracks = data.get("available_tracks", [])
-    
-    if tracks and message.text not in tracks:
-        kb = make_keyboard(tracks)
+    valid_tracks = await api_client.get_track_name_set()
+    if valid_tracks and message.text not in valid_tracks:
+        kb = make_tracks_keyboard(await api_client.get_track_names())
         await send_and_track(message, state, "Выбери направление кнопкой 👇", reply_markup=kb)
         return
     
-    await state.update_data(priority1=message.text)
-    
-    if data.get("is_editing"):
-        await show_summary(message, state)
-        return
-    
-    await ask_priority2(message, state)
+    await save_and_continue(message, state, "priority1", message.text, ask_priority2)
 
 
 async def ask_priority2(message: types.Message, state: FSMContext) -> None:
     """Ask for priority 2."""
-    data = await state.get_data()
-    tracks = data.get("available_tracks")
-    
-    if not tracks:
-        tracks = await get_track_names()
-        if tracks:
-            await state.update_data(available_tracks=tracks)
-    
+    tracks = await api_client.get_track_names()
     if tracks:
-        kb = make_keyboard(tracks)
+        kb = make_tracks_keyboard(tracks)
         await send_and_track(message, state, "Выбери **второй приоритет** 🎯", reply_markup=kb)
     else:
         await send_and_track(message, state, "Укажи **второй приоритет**:", reply_markup=REMOVE_KEYBOARD)
@@ -183,99 +176,32 @@ async def ask_priority2(message: types.Message, state: FSMContext) -> None:
     await state.set_state(InternForm.priority2)
 
 
-@router.message(InternForm.priority2)
+@form_step(InternForm.priority2)
 async def process_priority2(message: types.Message, state: FSMContext) -> None:
     """Handle priority 2 selection."""
-    data = await state.get_data()
-    tracks = data.get("available_tracks", [])
-    
-    if tracks and message.text not in tracks:
-        kb = make_keyboard(tracks)
+    valid_tracks = await api_client.get_track_name_set()
+    if valid_tracks and message.text not in valid_tracks:
+        kb = make_tracks_keyboard(await api_client.get_track_names())
         await send_and_track(message, state, "Выбери направление кнопкой 👇", reply_markup=kb)
         return
     
-    await state.update_data(priority2=message.text)
-    
-    if data.get("is_editing"):
-        await show_summary(message, state)
-        return
-    
-    kb = make_keyboard(COURSES, add_other=True)
-    await send_and_track(message, state, "Укажи **ступень обучения** 🎓", reply_markup=kb)
-    await state.set_state(InternForm.course)
+    await save_and_continue(message, state, "priority2", message.text, ask_course)
 
 
 # === Education ===
 
-@router.message(InternForm.course)
-async def process_course(message: types.Message, state: FSMContext) -> None:
-    """Handle course selection."""
-    if message.text == "Другое":
-        await send_and_track(message, state, "Напиши ступень обучения:", reply_markup=REMOVE_KEYBOARD)
-        await state.set_state(InternForm.course_custom)
-        return
-    
-    await state.update_data(course=message.text)
-    
-    data = await state.get_data()
-    if data.get("is_editing"):
-        await show_summary(message, state)
-        return
-    
-    await ask_university(message, state)
-
-
-@router.message(InternForm.course_custom)
-async def process_course_custom(message: types.Message, state: FSMContext) -> None:
-    """Handle custom course input."""
-    await state.update_data(course=message.text)
-    
-    data = await state.get_data()
-    if data.get("is_editing"):
-        await show_summary(message, state)
-        return
-    
-    await ask_university(message, state)
+async def ask_course(message: types.Message, state: FSMContext) -> None:
+    """Ask for course."""
+    await send_and_track(message, state, "Укажи **ступень обучения** 🎓", reply_markup=COURSES_KEYBOARD)
+    await state.set_state(InternForm.course)
 
 
 async def ask_university(message: types.Message, state: FSMContext) -> None:
     """Ask for university."""
-    kb = make_keyboard(UNIVERSITIES, add_other=True)
-    await send_and_track(message, state, "Выбери **ВУЗ** 🏛", reply_markup=kb)
+    await send_and_track(message, state, "Выбери **ВУЗ** 🏛", reply_markup=UNIVERSITIES_KEYBOARD)
     await state.set_state(InternForm.university)
 
 
-@router.message(InternForm.university)
-async def process_university(message: types.Message, state: FSMContext) -> None:
-    """Handle university selection."""
-    if message.text == "Другое":
-        await send_and_track(message, state, "Напиши название ВУЗа:", reply_markup=REMOVE_KEYBOARD)
-        await state.set_state(InternForm.university_custom)
-        return
-    
-    await state.update_data(university=message.text)
-    
-    data = await state.get_data()
-    if data.get("is_editing"):
-        await show_summary(message, state)
-        return
-    
-    await ask_specialty(message, state)
-
-
-@router.message(InternForm.university_custom)
-async def process_university_custom(message: types.Message, state: FSMContext) -> None:
-    """Handle custom university input."""
-    await state.update_data(university=message.text)
-    
-    data = await state.get_data()
-    if data.get("is_editing"):
-        await show_summary(message, state)
-        return
-    
-    await ask_specialty(message, state)
-
-
 async def ask_specialty(message: types.Message, state: FSMContext) -> None:
     """Ask for specialty."""
     await send_and_track(
@@ -286,117 +212,44 @@ async def ask_specialty(message: types.Message, state: FSMContext) -> None:
     await state.set_state(InternForm.specialty)
 
 
-@router.message(InternForm.specialty)
-async def process_specialty(message: types.Message, state: FSMContext) -> None:
-    """Handle specialty input."""
-    await state.update_data(specialty=message.text)
-    
-    data = await state.get_data()
-    if data.get("is_editing"):
-        await show_summary(message, state)
-        return
-    
-    kb = make_keyboard(["20", "30", "40"], row_width=3)
+# === Work Preferences ===
+
+async def ask_employment(message: types.Message, state: FSMContext) -> None:
+    """Ask for employment hours."""
     await send_and_track(
         message, state,
         "Какую **занятость** (часов в неделю) рассматриваешь? ⏰",
-        reply_markup=kb,
+        reply_markup=EMPLOYMENT_HOURS_KEYBOARD,
     )
     await state.set_state(InternForm.employment_hours)
 
 
-# === Work Preferences ===
-
-@router.message(InternForm.employment_hours)
+@form_step(InternForm.employment_hours)
 async def process_employment(message: types.Message, state: FSMContext) -> None:
     """Handle employment hours selection."""
-    valid = ["20", "30", "40"]
-    if message.text not in valid:
-        kb = make_keyboard(valid, row_width=3)
-        await send_and_track(message, state, "Выбери вариант кнопкой 👇", reply_markup=kb)
-        return
-    
-    await state.update_data(employment_hours=message.text)
-    
-    data = await state.get_data()
-    if data.get("is_editing"):
-        await show_summary(message, state)
-        return
-    
-    kb = make_keyboard(["Москва", "Санкт-Петербург", "Казань"], add_other=True)
-    await send_and_track(message, state, "Укажи **город** 🏙", reply_markup=kb)
-    await state.set_state(InternForm.city)
-
-
-@router.message(InternForm.city)
-async def process_city(message: types.Message, state: FSMContext) -> None:
-    """Handle city selection."""
-    if message.text == "Другое":
-        await send_and_track(message, state, "Напиши город:", reply_markup=REMOVE_KEYBOARD)
-        await state.set_state(InternForm.city_custom)
-        return
-    
-    await state.update_data(city=message.text)
-    
-    data = await state.get_data()
-    if data.get("is_editing"):
-        await show_summary(message, state)
+    if message.text not in VALID_EMPLOYMENT_HOURS:
+        await send_and_track(
+            message, state,
+            "Выбери вариант кнопкой 👇",
+            reply_markup=EMPLOYMENT_HOURS_KEYBOARD,
+        )
         return
     
-    await ask_source(message, state)
+    await save_and_continue(message, state, "employment_hours", message.text, ask_city)
 
 
-@router.message(InternForm.city_custom)
-async def process_city_custom(message: types.Message, state: FSMContext) -> None:
-    """Handle custom city input."""
-    await state.update_data(city=message.text)
-    
-    data = await state.get_data()
-    if data.get("is_editing"):
-        await show_summary(message, state)
-        return
-    
-    await ask_source(message, state)
+async def ask_city(message: types.Message, state: FSMContext) -> None:
+    """Ask for city."""
+    await send_and_track(message, state, "Укажи **город** 🏙", reply_markup=CITY_KEYBOARD)
+    await state.set_state(InternForm.city)
 
 
 async def ask_source(message: types.Message, state: FSMContext) -> None:
     """Ask for source."""
-    kb = make_keyboard(SOURCES, row_width=1)
-    await send_and_track(message, state, "Откуда узнал о стажировке? 📣", reply_markup=kb)
+    await send_and_track(message, state, "Откуда узнал о стажировке? 📣", reply_markup=SOURCES_KEYBOARD)
     await state.set_state(InternForm.source)
 
 
-@router.message(InternForm.source)
-async def process_source(message: types.Message, state: FSMContext) -> None:
-    """Handle source selection."""
-    if message.text == "Другое":
-        await send_and_track(message, state, "Укажи источник:", reply_markup=REMOVE_KEYBOARD)
-        await state.set_state(InternForm.source_custom)
-        return
-    
-    await state.update_data(source=message.text)
-    
-    data = await state.get_data()
-    if data.get("is_editing"):
-        await show_summary(message, state)
-        return
-    
-    await ask_birth_year(message, state)
-
-
-@router.message(InternForm.source_custom)
-async def process_source_custom(message: types.Message, state: FSMContext) -> None:
-    """Handle custom source input."""
-    await state.update_data(source=message.text)
-    
-    data = await state.get_data()
-    if data.get("is_editing"):
-        await show_summary(message, state)
-        return
-    
-    await ask_birth_year(message, state)
-
-
 # === Personal Info ===
 
 async def ask_birth_year(message: types.Message, state: FSMContext) -> None:
@@ -405,54 +258,22 @@ async def ask_birth_year(message: types.Message, state: FSMContext) -> None:
     await state.set_state(InternForm.birth_year)
 
 
-@router.message(InternForm.birth_year)
+@form_step(InternForm.birth_year)
 async def process_birth_year(message: types.Message, state: FSMContext) -> None:
     """Handle birth year input."""
-    if not message.text.isdigit() or len(message.text) != 4:
+    year = message.text or ""
+    # Length first; isascii() rejects non-ASCII digits the API won't accept
+    if len(year) != 4 or not (year.isascii() and year.isdigit()):
         await send_and_track(message, state, "Введи год (4 цифры).")
         return
     
-    await state.update_data(birth_year=message.text)
-    
-    data = await state.get_data()
-    if data.get("is_editing"):
-        await show_summary(message, state)
-        return
-    
-    kb = make_keyboard(["РФ"], add_other=True)
-    await send_and_track(message, state, "Укажи **гражданство** 🌍", reply_markup=kb)
-    await state.set_state(InternForm.citizenship)
-
-
-@router.message(InternForm.citizenship)
-async def process_citizenship(message: types.Message, state: FSMContext) -> None:
-    """Handle citizenship selection."""
-    if message.text == "Другое":
-        await send_and_track(message, state, "Напиши гражданство:", reply_markup=REMOVE_KEYBOARD)
-        await state.set_state(InternForm.citizenship_custom)
-        return
-    
-    await state.update_data(citizenship=message.text)
-    
-    data = await state.get_data()
-    if data.get("is_editing"):
-        await show_summary(message, state)
-        return
-    
-    await ask_tech_stack(message, state)
+    await save_and_continue(message, state, "birth_year", message.text, ask_citizenship)
 
 
-@router.message(InternForm.citizenship_custom)
-async def process_citizenship_custom(message: types.Message, state: FSMContext) -> None:
-    """Handle custom citizenship input."""
-    await state.update_data(citizenship=message.text)
-    
-    data = await state.get_data()
-    if data.get("is_editing"):
-        await show_summary(message, state)
-        return
-    
-    await ask_tech_stack(message, state)
+async def ask_citizenship(message: types.Message, state: FSMContext) -> None:
+    """Ask for citizenship."""
+    await send_and_track(message, state, "Укажи **гражданство** 🌍", reply_markup=CITIZENSHIP_KEYBOARD)
+    await state.set_state(InternForm.citizenship)
 
 
 async def ask_tech_stack(message: types.Message, state: FSMContext) -> None:
@@ -465,9 +286,116 @@ async def ask_tech_stack(message: types.Message, state: FSMContext) -> None:
     await state.set_state(InternForm.tech_stack)
 
 
-@router.message(InternForm.tech_stack)
+@form_step(InternForm.tech_stack)
 async def process_tech_stack(message: types.Message, state: FSMContext) -> None:
     """Handle tech stack input and show summary."""
     await track_user_message(message, state)
     await state.update_data(tech_stack=message.text, is_editing=False)
     await show_summary(message, state)
+
+
+# === Free text fields ===
+
+class TextStep(NamedTuple):
+    """Form step storing free text input as is."""
+    
+    state: State
+    field: str
+    next_step: FormHandler
+
+
+TEXT_STEPS = [
+    TextStep(InternForm.surname, "surname", ask_name),
+    TextStep(InternForm.name, "name", ask_phone),
+    TextStep(InternForm.resume_link, "resume_link", ask_priority1),
+    TextStep(InternForm.specialty, "specialty", ask_employment),
+]
+
+
+def make_text_handler(step: TextStep) -> FormHandler:
+    """Build free text input handler for one step."""
+    
+    async def process_text(message: types.Message, state: FSMContext) -> None:
+        """Handle free text input."""
+        await save_and_continue(message, state, step.field, message.text, step.next_step)
+    
+    return process_text
+
+
+for _text_step in TEXT_STEPS:
+    form_step(_text_step.state)(make_text_handler(_text_step))
+
+
+# === Choice fields with custom input ("Другое") ===
+
+class ChoiceStep(NamedTuple):
+    """Form step with option buttons and free input on "Другое"."""
+    
+    state: State
+    custom_state: State
+    field: str
+    custom_prompt: str
+    next_step: FormHandler
+
+
+CHOICE_STEPS = [
+    ChoiceStep(
+        InternForm.course, InternForm.course_custom,
+        "course", "Напиши ступень обучения:", ask_university,
+    ),
+    ChoiceStep(
+        InternForm.university, InternForm.university_custom,
+        "university", "Напиши название ВУЗа:", ask_specialty,
+    ),
+    ChoiceStep(
+        InternForm.city, InternForm.city_custom,
+        "city", "Напиши город:", ask_source,
+    ),
+    ChoiceStep(
+        InternForm.source, InternForm.source_custom,
+        "source", "Укажи источник:", ask_birth_year,
+    ),
+    ChoiceStep(
+        InternForm.citizenship, InternForm.citizenship_custom,
+        "citizenship", "Напиши гражданство:", ask_tech_stack,
+    ),
+]
+
+
+def make_choice_handlers(step: ChoiceStep):
+    """Build option and custom input handlers for one choice step."""
+    
+    async def process_option(message: types.Message, state: FSMContext) -> None:
+        """Handle option selection."""
+        if message.text == "Другое":
+            await send_and_track(message, state, step.custom_prompt, reply_markup=REMOVE_KEYBOARD)
+            await state.set_state(step.custom_state)
+            return
+        
+        await process_custom(message, state)
+    
+    async def process_custom(message: types.Message, state: FSMContext) -> None:
+        """Handle custom input."""
+        await save_and_continue(message, state, step.field, message.text, step.next_step)
+    
+    return process_option, process_custom
+
+
+for _step in CHOICE_STEPS:
+    _process_option, _process_custom = make_choice_handlers(_step)
+    form_step(_step.state)(_process_option)
+    form_step(_step.custom_state)(_process_custom)
+
+
+def find_form_handler(message: types.Message, raw_state: str | None) -> dict | bool:
+    """Filter: pass handler for current form state, skip other states."""
+    handler = FORM_HANDLERS.get(raw_state)
+    return {"form_handler": handler} if handler else False
+
+
+@router.message(find_form_handler)
+async def dispatch_form_step(
+    message: types.Message, state: FSMContext, form_handler: FormHandler
+) -> None:
+    """Route form message to its state handler."""
+    await form_handler(message, state)
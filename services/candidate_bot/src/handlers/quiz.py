@@ -1,18 +1,30 @@
 """Quiz handlers - all data via API, no local storage."""
 
+import asyncio
 import logging
 
 from aiogram import Router, types, F
 from aiogram.fsm.context import FSMContext
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 
+from src import texts
 from src.states import InternForm
 from src.api_client import api_client
-from src.keyboards import QUIZ_ANSWER_KEYBOARD
+from src.keyboards import (
+    QUIZ_ANSWER_KEYBOARD,
+    VALID_QUIZ_ANSWERS,
+    QuizAnswerCallback,
+    TrackCallback,
+)
 
 logger = logging.getLogger(__name__)
 router = Router()
 
+# (question id, question number) -> formatted text; question bank is small
+_question_text_cache: dict[tuple[str, object], str] = {}
+QUESTION_TEXT_CACHE_SIZE = 1024
+_format_option = "**{}.** {}".format
+
 
 @router.callback_query(F.data == "start_quiz")
 async def start_quiz_auto(callback: types.CallbackQuery, state: FSMContext) -> None:
@@ -22,9 +34,13 @@ async def start_quiz_auto(callback: types.CallbackQuery, state: FSMContext) -> N
     priority1 = data.get("priority1")
     
     # Если candidate_id не сохранён, получаем по telegram_id
+    # (параллельно с треками - запросы независимы)
     if not candidate_id:
         telegram_id = callback.from_user.id
-        candidate = await api_client.get_candidate_by_telegram_id(telegram_id)
+        candidate, tracks = await asyncio.gather(
+            api_client.get_candidate_by_telegram_id(telegram_id),
+            api_client.get_tracks(active_only=True),
+        )
         
         if not candidate:
             await callback.message.edit_text(
@@ -37,9 +53,9 @@ async def start_quiz_auto(callback: types.CallbackQuery, state: FSMContext) -> N
         candidate_id = candidate.get("id")
         priority1 = candidate.get("priority1")
         await state.update_data(candidate_id=candidate_id, priority1=priority1)
-    
-    # Получаем треки с API
-    tracks = await api_client.get_tracks(active_only=True)
+    else:
+        # Получаем треки с API
+        tracks = await api_client.get_tracks(active_only=True)
     
     if not tracks:
         await callback.message.edit_text(
@@ -49,26 +65,20 @@ async def start_quiz_auto(callback: types.CallbackQuery, state: FSMContext) -> N
         await callback.answer()
         return
     
-    # Ищем track_id по priority1
-    track_id = None
+    # Ищем track_id по priority1 (словарь из кэша треков)
+    track = await api_client.get_active_track_by_name(priority1)
+    track_id = track.get("id") if track else None
     track_name = priority1
-    for track in tracks:
-        if track.get("name") == priority1:
-            track_id = track.get("id")
-            break
     
     # Если не нашли priority1 - показываем выбор
     if not track_id:
-        buttons = []
-        for track in tracks:
-            tid = track.get("id")
-            tname = track.get("name", "Unknown")
-            buttons.append([
-                InlineKeyboardButton(
-                    text=tname,
-                    callback_data=f"track_{tid}"
-                )
-            ])
+        buttons = [
+            [InlineKeyboardButton(
+                text=t.get("name", "Unknown"),
+                callback_data=TrackCallback(id=t.get("id")).pack(),
+            )]
+            for t in tracks
+        ]
         
         keyboard = InlineKeyboardMarkup(inline_keyboard=buttons)
         
@@ -83,7 +93,6 @@ async def start_quiz_auto(callback: types.CallbackQuery, state: FSMContext) -> N
         return
     
     # Автоматически запускаем квиз по priority1
-    from src import texts
     await callback.message.edit_text(
         texts.QUIZ_START.format(track=track_name)
     )
@@ -110,8 +119,8 @@ async def start_quiz_auto(callback: types.CallbackQuery, state: FSMContext) -> N
         return
     
     await state.update_data(
-        quiz_session_id=str(session_id),
-        current_question_id=str(question.get("id")),
+        quiz_session_id=session_id,
+        current_question_id=question.get("id"),
         quiz_track_id=track_id,
     )
     
@@ -121,16 +130,14 @@ async def start_quiz_auto(callback: types.CallbackQuery, state: FSMContext) -> N
     await callback.answer()
 
 
-@router.callback_query(F.data.startswith("track_"), InternForm.selecting_track)
-async def start_quiz_with_track(callback: types.CallbackQuery, state: FSMContext) -> None:
+@router.callback_query(TrackCallback.filter(), InternForm.selecting_track)
+async def start_quiz_with_track(
+    callback: types.CallbackQuery,
+    state: FSMContext,
+    callback_data: TrackCallback,
+) -> None:
     """Start quiz with selected track ID."""
-    # Извлекаем track_id из callback_data
-    track_id_str = callback.data.removeprefix("track_")
-    try:
-        track_id = int(track_id_str)
-    except ValueError:
-        await callback.answer("❌ Неверный ID трека")
-        return
+    track_id = callback_data.id
     
     data = await state.get_data()
     candidate_id = data.get("candidate_id")
@@ -169,10 +176,10 @@ async def start_quiz_with_track(callback: types.CallbackQuery, state: FSMContext
         await callback.answer()
         return
     
-    # Сохраняем в FSM только ID (всё из API)
+    # Сохраняем в FSM только ID (всё из API, уже строки из JSON)
     await state.update_data(
-        quiz_session_id=str(session_id),
-        current_question_id=str(question.get("id")),
+        quiz_session_id=session_id,
+        current_question_id=question.get("id"),
         quiz_track_id=track_id,
     )
     
@@ -201,13 +208,18 @@ def format_question(question: dict) -> str:
         "question_number": 1
     }
     """
+    qid = question.get("id")
+    number = question.get("question_number", "?")
+    cache_key = (qid, number)
+    if qid is not None and cache_key in _question_text_cache:
+        return _question_text_cache[cache_key]
+    
     text = question.get("text", "Вопрос")
     block = question.get("block_name", "")
-    number = question.get("question_number", "?")
     
     options = question.get("options", [])
     options_text = "\n".join(
-        f"**{opt.get('key', '?')}.** {opt.get('text', '')}"
+        _format_option(opt.get("key", "?"), opt.get("text", ""))
         for opt in options
     )
     
@@ -215,14 +227,26 @@ def format_question(question: dict) -> str:
     if block:
         header += f" ({block})"
     
-    return f"{header}\n\n{text}\n\n{options_text}"
+    result = f"{header}\n\n{text}\n\n{options_text}"
+    if qid is not None:
+        if len(_question_text_cache) >= QUESTION_TEXT_CACHE_SIZE:
+            _question_text_cache.clear()
+        _question_text_cache[cache_key] = result
+    return result
 
 
-@router.callback_query(F.data.startswith("quiz_ans_"), InternForm.in_quiz)
-async def process_answer(callback: types.CallbackQuery, state: FSMContext) -> None:
+@router.callback_query(QuizAnswerCallback.filter(), InternForm.in_quiz)
+async def process_answer(
+    callback: types.CallbackQuery,
+    state: FSMContext,
+    callback_data: QuizAnswerCallback,
+) -> None:
     """Process quiz answer."""
-    # Извлекаем ответ (A, B, C, D)
-    answer = callback.data.split("_")[-1]  # "quiz_ans_A" -> "A"
+    # Ответ (A, B, C, D)
+    answer = callback_data.key
+    if answer not in VALID_QUIZ_ANSWERS:
+        await callback.answer("❌ Неверный вариант ответа")
+        return
     
     data = await state.get_data()
     session_id = data.get("quiz_session_id")
@@ -248,7 +272,7 @@ async def process_answer(callback: types.CallbackQuery, state: FSMContext) -> No
     
     if response_type == "end":
         # Квиз завершён
-        await handle_quiz_end(callback, state, response)
+        await handle_quiz_end(callback, state, response, data)
         return
     
     if response_type == "continue":
@@ -259,23 +283,27 @@ async def process_answer(callback: types.CallbackQuery, state: FSMContext) -> No
             await callback.answer("❌ Ошибка: нет следующего вопроса")
             return
         
-        # Обновляем только question_id в FSM
-        await state.update_data(
-            current_question_id=str(next_question.get("id")),
-        )
-        
-        # Форматируем и показываем
-        text = format_question(next_question)
-        
-        await callback.message.edit_text(
-            text,
-            reply_markup=QUIZ_ANSWER_KEYBOARD,
-        )
+        # Тот же вопрос уже на экране - edit_text вернул бы "message is not modified"
+        if next_question.get("id") != question_id:
+            # Обновляем только question_id в FSM
+            await state.update_data(
+                current_question_id=next_question.get("id"),
+            )
+            
+            # Форматируем и показываем
+            text = format_question(next_question)
+            
+            await callback.message.edit_text(
+                text,
+                reply_markup=QUIZ_ANSWER_KEYBOARD,
+            )
     else:
         # Неизвестный тип ответа
-        logger.error(f"Unknown quiz response type: {response_type}")
+        logger.error("Unknown quiz response type: %s", response_type)
         await callback.answer("❌ Неизвестный ответ от сервера")
+        return
     
+    # Telegram ждёт ответа на callback даже после edit_text
     await callback.answer()
 
 
@@ -283,12 +311,13 @@ async def handle_quiz_end(
     callback: types.CallbackQuery,
     state: FSMContext,
     response: dict,
+    data: dict,
 ) -> None:
-    """Handle quiz completion."""
-    from src import texts
+    """Handle quiz completion.
     
-    # Получаем данные
-    data = await state.get_data()
+    Args:
+        data: FSM data already read by process_answer.
+    """
     candidate_id = data.get("candidate_id")
     track_id = data.get("quiz_track_id")
     name = data.get("name", "друг")
@@ -299,12 +328,12 @@ async def handle_quiz_end(
     accuracy = 0
     
     if candidate_id:
-        attempts = await api_client.get_quiz_attempts(str(candidate_id), track_id)
+        attempts = await api_client.get_quiz_attempts(str(candidate_id), track_id, limit=1)
         if attempts and attempts.get("attempts"):
             last_attempt = attempts["attempts"][0]
             total = last_attempt.get("total_questions", 0)
             correct = last_attempt.get("correct_answers", 0)
-            accuracy = int((correct / total * 100)) if total > 0 else 0
+            accuracy = correct * 100 // total if total > 0 else 0
     
     text = texts.QUIZ_COMPLETED.format(
         name=name,
@@ -1,8 +1,8 @@
 """Resume PDF upload handler."""
 
+import asyncio
+import io
 import logging
-import os
-import tempfile
 
 from aiogram import Router, types, F
 from aiogram.fsm.context import FSMContext
@@ -17,6 +17,47 @@ from src.message_utils import track_bot_message, track_user_message
 logger = logging.getLogger(__name__)
 router = Router()
 
+# Every PDF starts with this header, whatever the declared mime type
+PDF_MAGIC = b"%PDF-"
+
+NOT_FOUND = "Не найдено"
+NOT_SELECTED = "Не выбрано"
+
+# (FSM key, parser key, fallback when parser found nothing)
+RESUME_FIELDS = (
+    ("surname", "surname", NOT_FOUND),
+    ("name", "name", NOT_FOUND),
+    ("phone", "phone", NOT_FOUND),
+    ("email", "email", NOT_FOUND),
+    ("resume_link", "resume_link", "Загружено PDF"),
+    ("priority1", "priority", NOT_SELECTED),
+    ("course", "course", NOT_FOUND),
+    ("university", "university", NOT_FOUND),
+    ("specialty", "specialty", NOT_FOUND),
+    ("city", "city", NOT_FOUND),
+    ("birth_year", "birth_year", NOT_FOUND),
+    ("citizenship", "citizenship", NOT_FOUND),
+    ("tech_stack", "tech_stack", NOT_FOUND),
+)
+
+# Fields the parser never fills
+RESUME_FIXED_FIELDS = {
+    "priority2": NOT_SELECTED,
+    "employment_hours": NOT_SELECTED,
+    "source": "Загрузка PDF",
+}
+
+
+def _parse_resume(pdf_file: io.BytesIO) -> dict | None:
+    """Extract resume data, or None if file doesn't look like a resume.
+    
+    CPU-bound (pdfplumber), run via asyncio.to_thread.
+    """
+    parser = ResumeParser(pdf_file)
+    if not parser.validate_content():
+        return None
+    return parser.parse_all(universities_list=UNIVERSITIES)
+
 
 @router.message(InternForm.upload_resume, F.document)
 async def process_resume_upload(message: types.Message, state: FSMContext) -> None:
@@ -44,20 +85,23 @@ async def process_resume_upload(message: types.Message, state: FSMContext) -> No
     sent = await message.answer("📄 Файл получен. Обрабатываю...")
     await track_bot_message(sent, state)
     
-    # Download to temp file
+    # Download into memory (max 5 MB, no temp file to clean up)
     try:
         from src.bot import bot
         
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            await bot.download(document, destination=tmp.name)
-            tmp_path = tmp.name
+        buffer = io.BytesIO()
+        await bot.download(document, destination=buffer)
+        buffer.seek(0)
         
-        # Parse resume
-        parser = ResumeParser(tmp_path)
+        if buffer.read(len(PDF_MAGIC)) != PDF_MAGIC:
+            # Mislabeled file, don't hand it to the PDF parser
+            extracted = None
+        else:
+            buffer.seek(0)
+            # Parse and validate off the event loop
+            extracted = await asyncio.to_thread(_parse_resume, buffer)
         
-        # Validate content
-        if not parser.validate_content():
-            os.unlink(tmp_path)
+        if extracted is None:
             sent = await message.answer(
                 "❌ Файл не похож на резюме.\n"
                 "Проверь файл или заполни анкету вручную.\n\n"
@@ -68,38 +112,20 @@ async def process_resume_upload(message: types.Message, state: FSMContext) -> No
             await state.set_state(InternForm.surname)
             return
         
-        # Extract data
-        extracted = parser.parse_all(universities_list=UNIVERSITIES)
-        
-        # Clean up temp file
-        os.unlink(tmp_path)
-        
-        # Update state with extracted data
-        await state.update_data(
-            surname=extracted.get("surname") or "Не найдено",
-            name=extracted.get("name") or "Не найдено",
-            phone=extracted.get("phone") or "Не найдено",
-            email=extracted.get("email") or "Не найдено",
-            resume_link=extracted.get("resume_link") or "Загружено PDF",
-            priority1=extracted.get("priority") or "Не выбрано",
-            priority2="Не выбрано",
-            course=extracted.get("course") or "Не найдено",
-            university=extracted.get("university") or "Не найдено",
-            specialty=extracted.get("specialty") or "Не найдено",
-            employment_hours="Не выбрано",
-            city=extracted.get("city") or "Не найдено",
-            source="Загрузка PDF",
-            birth_year=extracted.get("birth_year") or "Не найдено",
-            citizenship=extracted.get("citizenship") or "Не найдено",
-            tech_stack=extracted.get("tech_stack") or "Не найдено",
-        )
+        # Update state with extracted data (empty values fall back too)
+        form_data = {
+            key: extracted.get(parsed_key) or default
+            for key, parsed_key, default in RESUME_FIELDS
+        }
+        form_data.update(RESUME_FIXED_FIELDS)
+        await state.update_data(form_data)
         
         sent = await message.answer("✅ Данные извлечены! Проверь и заполни пропуски.")
         await track_bot_message(sent, state)
         await show_summary(message, state)
         
-    except Exception as e:
-        logger.exception(f"Error parsing resume: {e}")
+    except Exception:
+        logger.exception("Error parsing resume")
         sent = await message.answer(
             "❌ Ошибка при чтении файла. Заполним вручную.\n\n"
             "Введи свою **Фамилию**:",
@@ -5,9 +5,14 @@ import logging
 from aiogram import Router, types
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
-from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 
-from src.keyboards import make_keyboard, REMOVE_KEYBOARD
+from src.keyboards import (
+    CHOICE_MANUAL,
+    CHOICE_RESUME,
+    QUIZ_START_KEYBOARD,
+    REMOVE_KEYBOARD,
+    WELCOME_CHOICE_KEYBOARD,
+)
 from src.states import InternForm
 from src.message_utils import track_bot_message, track_user_message
 from src.api_client import api_client
@@ -33,12 +38,7 @@ async def cmd_start(message: types.Message, state: FSMContext) -> None:
         return
     
     # New candidate - show welcome
-    kb = make_keyboard(
-        ["📝 Заполнить вручную", "📄 Загрузить резюме (PDF)"],
-        row_width=1,
-    )
-    
-    sent = await message.answer(texts.WELCOME_NEW, reply_markup=kb)
+    sent = await message.answer(texts.WELCOME_NEW, reply_markup=WELCOME_CHOICE_KEYBOARD)
     await track_bot_message(sent, state)
     await state.set_state(InternForm.waiting_for_choice)
 
@@ -55,7 +55,7 @@ async def show_status(message: types.Message, state: FSMContext, candidate: dict
     show_quiz_button = True
     
     if candidate_id:
-        attempts = await api_client.get_quiz_attempts(str(candidate_id))
+        attempts = await api_client.get_quiz_attempts(str(candidate_id), limit=1)
         if attempts and attempts.get("attempts"):
             last_attempt = attempts["attempts"][0]
             status = last_attempt.get("status")
@@ -63,7 +63,7 @@ async def show_status(message: types.Message, state: FSMContext, candidate: dict
             if status == "completed":
                 total = last_attempt.get("total_questions", 0)
                 correct = last_attempt.get("correct_answers", 0)
-                accuracy = int((correct / total * 100)) if total > 0 else 0
+                accuracy = correct * 100 // total if total > 0 else 0
                 quiz_status = texts.QUIZ_PASSED.format(score=accuracy)
                 next_steps = texts.NEXT_STEPS_WAIT
                 show_quiz_button = False
@@ -78,13 +78,7 @@ async def show_status(message: types.Message, state: FSMContext, candidate: dict
         next_steps=next_steps,
     )
     
-    # Keyboard
-    if show_quiz_button:
-        keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(text="🚀 Пройти квиз", callback_data="start_quiz")],
-        ])
-    else:
-        keyboard = None
+    keyboard = QUIZ_START_KEYBOARD if show_quiz_button else None
     
     await state.update_data(
         candidate_id=candidate_id,
@@ -100,12 +94,12 @@ async def process_choice(message: types.Message, state: FSMContext) -> None:
     await track_user_message(message, state)
     text = message.text
     
-    if text == "📝 Заполнить вручную":
+    if text == CHOICE_MANUAL:
         sent = await message.answer(texts.FORM_START, reply_markup=REMOVE_KEYBOARD)
         await track_bot_message(sent, state)
         await state.set_state(InternForm.surname)
         
-    elif text == "📄 Загрузить резюме (PDF)":
+    elif text == CHOICE_RESUME:
         sent = await message.answer(texts.FORM_RESUME_UPLOAD, reply_markup=REMOVE_KEYBOARD)
         await track_bot_message(sent, state)
         await state.set_state(InternForm.upload_resume)
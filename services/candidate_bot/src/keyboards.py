@@ -1,5 +1,8 @@
 """Keyboard builders."""
 
+from collections.abc import Sequence
+
+from aiogram.filters.callback_data import CallbackData
 from aiogram.types import (
     ReplyKeyboardMarkup,
     KeyboardButton,
@@ -8,9 +11,23 @@ from aiogram.types import (
     ReplyKeyboardRemove,
 )
 
+from src.data_loader import COURSES, UNIVERSITIES, SOURCES
+
+
+class TrackCallback(CallbackData, prefix="track"):
+    """Quiz track selection button."""
+    
+    id: int
+
+
+class QuizAnswerCallback(CallbackData, prefix="quiz_ans"):
+    """Quiz answer button."""
+    
+    key: str
+
 
 def make_keyboard(
-    items: list[str],
+    items: Sequence[str],
     add_other: bool = False,
     request_contact: bool = False,
     row_width: int = 2,
@@ -79,17 +96,98 @@ def make_inline_keyboard(
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+# (track names list, keyboard) built for the last seen tracks
+_tracks_keyboard: tuple[list[str] | None, ReplyKeyboardMarkup | None] = (None, None)
+
+
+def make_tracks_keyboard(track_names: list[str]) -> ReplyKeyboardMarkup:
+    """Get keyboard for track names, reused while the list is unchanged.
+    
+    api_client returns the same names list object until tracks are
+    refreshed, so identity is enough to detect changes.
+    """
+    global _tracks_keyboard
+    if _tracks_keyboard[0] is not track_names:
+        _tracks_keyboard = (track_names, make_keyboard(track_names))
+    return _tracks_keyboard[1]
+
+
+# Static option lists
+EMPLOYMENT_HOURS = ["20", "30", "40"]
+VALID_EMPLOYMENT_HOURS = frozenset(EMPLOYMENT_HOURS)
+CITIES = ["Москва", "Санкт-Петербург", "Казань"]
+CITIZENSHIPS = ["РФ"]
+CHOICE_MANUAL = "📝 Заполнить вручную"
+CHOICE_RESUME = "📄 Загрузить резюме (PDF)"
+
+
 # Pre-built keyboards
 REMOVE_KEYBOARD = ReplyKeyboardRemove()
 
+WELCOME_CHOICE_KEYBOARD = make_keyboard([CHOICE_MANUAL, CHOICE_RESUME], row_width=1)
+PHONE_KEYBOARD = make_keyboard([], request_contact=True)
+COURSES_KEYBOARD = make_keyboard(COURSES, add_other=True)
+UNIVERSITIES_KEYBOARD = make_keyboard(UNIVERSITIES, add_other=True)
+EMPLOYMENT_HOURS_KEYBOARD = make_keyboard(EMPLOYMENT_HOURS, row_width=3)
+CITY_KEYBOARD = make_keyboard(CITIES, add_other=True)
+CITIZENSHIP_KEYBOARD = make_keyboard(CITIZENSHIPS, add_other=True)
+SOURCES_KEYBOARD = make_keyboard(SOURCES, row_width=1)
+
+VALID_QUIZ_ANSWERS = frozenset({"A", "B", "C", "D"})
+
 QUIZ_ANSWER_KEYBOARD = InlineKeyboardMarkup(inline_keyboard=[
     [
-        InlineKeyboardButton(text="A", callback_data="quiz_ans_A"),
-        InlineKeyboardButton(text="B", callback_data="quiz_ans_B"),
+        InlineKeyboardButton(text="A", callback_data=QuizAnswerCallback(key="A").pack()),
+        InlineKeyboardButton(text="B", callback_data=QuizAnswerCallback(key="B").pack()),
     ],
     [
-        InlineKeyboardButton(text="C", callback_data="quiz_ans_C"),
-        InlineKeyboardButton(text="D", callback_data="quiz_ans_D"),
+        InlineKeyboardButton(text="C", callback_data=QuizAnswerCallback(key="C").pack()),
+        InlineKeyboardButton(text="D", callback_data=QuizAnswerCallback(key="D").pack()),
     ],
 ])
 
+# Quiz entry buttons (callback data handled in handlers/quiz.py)
+QUIZ_START_KEYBOARD = InlineKeyboardMarkup(inline_keyboard=[
+    [InlineKeyboardButton(text="🚀 Пройти квиз", callback_data="start_quiz")],
+])
+QUIZ_BEGIN_KEYBOARD = InlineKeyboardMarkup(inline_keyboard=[
+    [InlineKeyboardButton(text="🚀 Начать квиз", callback_data="start_quiz")],
+])
+
+# Summary edit buttons (callback data handled in handlers/edit.py)
+SUMMARY_KEYBOARD = InlineKeyboardMarkup(inline_keyboard=[
+    [
+        InlineKeyboardButton(text="Фамилия", callback_data="edit_surname"),
+        InlineKeyboardButton(text="Имя", callback_data="edit_name"),
+    ],
+    [
+        InlineKeyboardButton(text="Телефон", callback_data="edit_phone"),
+        InlineKeyboardButton(text="Email", callback_data="edit_email"),
+    ],
+    [
+        InlineKeyboardButton(text="Резюме", callback_data="edit_resume_link"),
+    ],
+    [
+        InlineKeyboardButton(text="Приоритет 1", callback_data="edit_priority1"),
+        InlineKeyboardButton(text="Приоритет 2", callback_data="edit_priority2"),
+    ],
+    [
+        InlineKeyboardButton(text="Курс", callback_data="edit_course"),
+        InlineKeyboardButton(text="ВУЗ", callback_data="edit_university"),
+    ],
+    [
+        InlineKeyboardButton(text="Специальность", callback_data="edit_specialty"),
+        InlineKeyboardButton(text="Занятость", callback_data="edit_employment_hours"),
+    ],
+    [
+        InlineKeyboardButton(text="Город", callback_data="edit_city"),
+        InlineKeyboardButton(text="Год рожд.", callback_data="edit_birth_year"),
+    ],
+    [
+        InlineKeyboardButton(text="Гражданство", callback_data="edit_citizenship"),
+        InlineKeyboardButton(text="Стек", callback_data="edit_tech_stack"),
+    ],
+    [
+        InlineKeyboardButton(text="✅ Отправить анкету", callback_data="submit_form"),
+    ],
+])
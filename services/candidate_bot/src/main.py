@@ -1,44 +1,76 @@
 """Candidate Bot - FastAPI webhook server for Kubernetes."""
 
+import asyncio
+import hmac
 import logging
 from contextlib import asynccontextmanager
 
 from aiogram import types
 from aiogram.types import Update
-from fastapi import FastAPI, Request, HTTPException
+from fastapi import Depends, FastAPI, Request, HTTPException
 from fastapi.responses import JSONResponse
 
 from src.config import config
 from src.bot import bot, dp, setup_handlers
+from src.api_client import api_client
 
-# Configure logging
+# Configure logging (unknown LOG_LEVEL falls back to INFO instead of crashing)
 logging.basicConfig(
-    level=getattr(logging, config.log_level),
+    level=logging.getLevelNamesMapping().get(config.log_level.upper(), logging.INFO),
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
 
+# Max update tasks pending (queued on a user's lock or running) at once
+MAX_CONCURRENT_UPDATES = 100
+
+# Handlers only use these; Telegram skips other update types entirely
+ALLOWED_UPDATES = ["message", "callback_query"]
+# Long polling timeout for dev mode, seconds
+POLLING_TIMEOUT = 30
+
+# Strong references to running update tasks (asyncio keeps only weak ones)
+_background_tasks: set[asyncio.Task] = set()
+_update_semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPDATES)
+
+
+async def process_update(update: Update) -> None:
+    """Feed update to dispatcher in background.
+    
+    The caller holds an _update_semaphore slot for this task.
+    """
+    try:
+        await dp.feed_update(bot, update)
+    except Exception:
+        logger.exception("Error processing update %s", update.update_id)
+
+
+def _release_update_slot(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    _update_semaphore.release()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     # Startup
-    logger.info(f"Starting Candidate Bot [{config.environment}]")
+    logger.info("Starting Candidate Bot [%s]", config.environment)
     setup_handlers()
+    await api_client.open()
     
     # Set webhook if configured
     if config.webhook_base_url and config.bot_token and config.webhook_secret:
         webhook_url = config.webhook_url
-        logger.info(f"Setting webhook: {webhook_url}")
+        logger.info("Setting webhook: %s", webhook_url)
         try:
             await bot.set_webhook(
                 url=webhook_url,
                 secret_token=config.webhook_secret,
-                allowed_updates=["message", "callback_query"],
+                allowed_updates=ALLOWED_UPDATES,
             )
             logger.info("Webhook set successfully")
         except Exception as e:
-            logger.error(f"Failed to set webhook: {e}")
+            logger.error("Failed to set webhook: %s", e)
     else:
         logger.warning("Webhook not configured (missing WEBHOOK_BASE_URL)")
     
@@ -46,6 +78,10 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down Candidate Bot")
+    if _background_tasks:
+        await asyncio.gather(*_background_tasks, return_exceptions=True)
+    await api_client.close()
+    await dp.storage.close()
     await bot.session.close()
 
 
@@ -80,33 +116,49 @@ async def root() -> dict:
     }
 
 
-@app.post(f"{config.webhook_path}/{{secret}}")
-async def telegram_webhook(secret: str, request: Request) -> JSONResponse:
+async def verify_webhook_secret(secret: str) -> None:
+    """Reject requests with wrong secret before the body is read."""
+    # Constant-time comparison, doesn't leak matching prefix length
+    if not hmac.compare_digest(secret.encode(), config.webhook_secret.encode()):
+        logger.warning("Invalid webhook secret received")
+        raise HTTPException(status_code=403, detail="Invalid webhook secret")
+
+
+@app.post(
+    f"{config.webhook_path}/{{secret}}",
+    dependencies=[Depends(verify_webhook_secret)],
+)
+async def telegram_webhook(request: Request) -> JSONResponse:
     """Telegram webhook endpoint.
     
     URL format: /tg/candidate/{secret}
     The secret must match WEBHOOK_SECRET environment variable.
-    """
-    # Verify secret
-    if secret != config.webhook_secret:
-        logger.warning("Invalid webhook secret received")
-        raise HTTPException(status_code=403, detail="Invalid webhook secret")
     
+    Telegram is answered before any handler runs, so replies are always
+    sent via Bot API calls and never as the webhook response body.
+    """
     # Parse update
     try:
-        body = await request.json()
-        update = Update.model_validate(body, context={"bot": bot})
-        
-        logger.debug(f"Received update: {update.update_id}")
-        
-        # Process update
-        await dp.feed_update(bot, update)
-        
+        # Raw bytes straight to pydantic, no intermediate dict
+        body = await request.body()
+        update = Update.model_validate_json(body, context={"bot": bot})
     except Exception as e:
-        logger.exception(f"Error processing webhook: {e}")
+        logger.exception("Error parsing webhook update")
         # Return 200 anyway to prevent Telegram from retrying
         return JSONResponse({"ok": False, "error": str(e)})
     
+    logger.debug("Received update: %s", update.update_id)
+    
+    # Take a slot before scheduling, so pending tasks (and the updates
+    # they hold) are bounded. When all slots are busy the webhook waits,
+    # which pushes back on Telegram instead of queueing in memory.
+    await _update_semaphore.acquire()
+    
+    # Process update in background, answer Telegram right away
+    task = asyncio.create_task(process_update(update))
+    _background_tasks.add(task)
+    task.add_done_callback(_release_update_slot)
+    
     return JSONResponse({"ok": True})
 
 
@@ -118,6 +170,10 @@ if __name__ == "__main__":
         """Run bot in polling mode for local development."""
         logger.info("Running in polling mode (dev)")
         setup_handlers()
-        await dp.start_polling(bot)
+        await dp.start_polling(
+            bot,
+            allowed_updates=ALLOWED_UPDATES,
+            polling_timeout=POLLING_TIMEOUT,
+        )
     
     asyncio.run(main())
@@ -1,18 +1,85 @@
 """Message utilities for clean chat experience."""
 
+import asyncio
 import logging
-from aiogram import types, Bot
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from typing import Any
+
+from aiogram import BaseMiddleware, Bot, types
 from aiogram.fsm.context import FSMContext
+from aiogram.types import TelegramObject
 
 logger = logging.getLogger(__name__)
 
+# Tracking writes scheduled while handling the current update
+_pending_tracking: ContextVar[set[asyncio.Task] | None] = ContextVar(
+    "pending_tracking", default=None
+)
+# Strong refs for writes scheduled outside TrackingMiddleware
+_background_tasks: set[asyncio.Task] = set()
+
+
+async def _append_message_ids(state: FSMContext, message_ids: tuple[int, ...]) -> None:
+    """Append message IDs to the tracked list in one storage write."""
+    await state.storage.append_tracked(state.key, message_ids)
+
+
+def _log_tracking_error(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception():
+        logger.error("Failed to track messages: %s", task.exception())
+
+
+def track_in_background(state: FSMContext, *message_ids: int) -> None:
+    """Track message IDs without blocking the handler.
+
+    Writes are finished by TrackingMiddleware before the update is done,
+    so the next update of the same user sees them.
+    """
+    task = asyncio.create_task(_append_message_ids(state, message_ids))
+    task.add_done_callback(_log_tracking_error)
+    pending = _pending_tracking.get()
+    if pending is None:
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+    else:
+        pending.add(task)
+
+
+async def wait_tracking() -> None:
+    """Wait for background tracking writes of the current update."""
+    pending = _pending_tracking.get()
+    while pending:
+        tasks = list(pending)
+        pending.clear()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class TrackingMiddleware(BaseMiddleware):
+    """Finish background tracking writes before releasing the update.
+
+    Must run inside FSM middleware (dispatcher outer middleware), so writes
+    complete while the user's event isolation lock is still held.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        token = _pending_tracking.set(set())
+        try:
+            return await handler(event, data)
+        finally:
+            await wait_tracking()
+            _pending_tracking.reset(token)
+
 
 async def track_message(state: FSMContext, message_id: int) -> None:
     """Track message ID for later deletion."""
-    data = await state.get_data()
-    message_ids = data.get("tracked_message_ids", [])
-    message_ids.append(message_id)
-    await state.update_data(tracked_message_ids=message_ids)
+    await wait_tracking()
+    await _append_message_ids(state, (message_id,))
 
 
 async def track_bot_message(message: types.Message, state: FSMContext) -> None:
@@ -25,17 +92,30 @@ async def track_user_message(message: types.Message, state: FSMContext) -> None:
     await track_message(state, message.message_id)
 
 
+async def _safe_delete(message: types.Message) -> None:
+    try:
+        await message.delete()
+    except Exception as e:
+        logger.debug("Cannot delete message %s: %s", message.message_id, e)
+
+
+def delete_in_background(message: types.Message) -> None:
+    """Delete message without waiting for the Telegram API round-trip."""
+    task = asyncio.create_task(_safe_delete(message))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
 async def clear_chat_history(bot: Bot, chat_id: int, state: FSMContext) -> None:
     """Delete all tracked messages from chat."""
-    data = await state.get_data()
-    message_ids = data.get("tracked_message_ids", [])
-    
-    for msg_id in message_ids:
-        try:
-            await bot.delete_message(chat_id, msg_id)
-        except Exception as e:
-            logger.debug(f"Cannot delete message {msg_id}: {e}")
-    
-    # Clear tracked IDs
-    await state.update_data(tracked_message_ids=[])
+    await wait_tracking()
+    message_ids = await state.storage.pop_tracked(state.key)
 
+    # Deletes are independent, send them all at once
+    results = await asyncio.gather(
+        *(bot.delete_message(chat_id, msg_id) for msg_id in message_ids),
+        return_exceptions=True,
+    )
+    for msg_id, result in zip(message_ids, results):
+        if isinstance(result, Exception):
+            logger.debug("Cannot delete message %s: %s", msg_id, result)
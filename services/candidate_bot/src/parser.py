@@ -2,31 +2,92 @@
 
 import logging
 import re
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import BinaryIO
 
 import pdfplumber
 
 logger = logging.getLogger(__name__)
 
+# Page text extraction dominates parse time, padded PDFs are cut off
+MAX_PAGES = 5
+
+# Compiled once at import
+EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+PHONE_RE = re.compile(r'(\+7|8)[\s\(-]*\d{3}[\s\)-]*\d{3}[\s-]*\d{2}[\s-]*\d{2}')
+URL_RE = re.compile(r'https?://[^\s]+')
+YEAR_RE = re.compile(r'\b(19\d{2}|20\d{2})\b')
+YEAR_RANGE_RE = re.compile(r'(20\d{2})\s*[-—]\s*(20\d{2}|наст|н\.в)')
+COURSE_RE = re.compile(r'(\d)\s*курс', re.IGNORECASE)
+TOKEN_SPLIT_RE = re.compile(r'[\s,;]+')
+SPECIALTY_RES = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r'Факультет[:\s]+([^\n]+)',
+        r'Специальность[:\s]+([^\n]+)',
+        r'Направление[:\s]+([^\n]+)',
+        r'Образовательная программа[:\s]+([^\n]+)',
+    )
+)
+
+# Links to these are preferred as resume_link
+PRIORITY_LINK_DOMAINS = ('github.com', 'hh.ru', 'linkedin.com', 't.me')
+
+# Keywords typically found in resumes
+RESUME_KEYWORDS = (
+    "резюме", "cv", "образование", "опыт работы", "навыки",
+    "skills", "education", "experience", "contacts", "контакты",
+    "телефон", "email", "почта", "гражданство", "родился", "рождения",
+)
+
+COMMON_TECH = (
+    "Python", "Java", "C++", "C#", "Go", "Golang", "JavaScript", "TypeScript",
+    "React", "Vue", "Angular", "Docker", "Kubernetes", "SQL", "PostgreSQL",
+    "MySQL", "MongoDB", "Redis", "Git", "Linux", "Bash", "CI/CD", "Django",
+    "FastAPI", "Flask", "Spring", ".NET", "ML", "AI", "Data Science",
+)
+# Lowercase token -> display name, and position for stable output order
+TECH_BY_LOWER = {tech.lower(): tech for tech in COMMON_TECH}
+TECH_ORDER = {lower: i for i, lower in enumerate(TECH_BY_LOWER)}
+
+
+@lru_cache(maxsize=8)
+def _university_lookup(universities: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    """Build (lowercase name, name) pairs, longest first (cached per list)."""
+    return tuple(
+        (univ.lower(), univ)
+        for univ in sorted(universities, key=len, reverse=True)
+    )
+
 
 class ResumeParser:
     """Parse PDF resume and extract candidate data."""
     
-    def __init__(self, pdf_path: str):
-        self.pdf_path = pdf_path
-        self.text = self._extract_text()
+    def __init__(self, pdf_file: str | BinaryIO, max_pages: int = MAX_PAGES):
+        """Load PDF text.
+        
+        Args:
+            pdf_file: Path to PDF or binary file-like object (e.g. BytesIO).
+            max_pages: Only the first pages are read, resumes are short.
+        """
+        self.pdf_file = pdf_file
+        self.text = self._extract_text(max_pages)
+        # Lowercased once, shared by all case-insensitive lookups
+        self.text_lower = self.text.lower()
 
-    def _extract_text(self) -> str:
-        """Extract all text from PDF."""
-        text = ""
+    def _extract_text(self, max_pages: int) -> str:
+        """Extract text from the first max_pages pages of the PDF."""
+        parts = []
         try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                for page in pdf.pages:
+            with pdfplumber.open(self.pdf_file) as pdf:
+                for page in pdf.pages[:max_pages]:
                     extracted = page.extract_text()
                     if extracted:
-                        text += extracted + "\n"
+                        parts.append(extracted)
         except Exception as e:
-            logger.error(f"Error reading PDF: {e}")
-        return text
+            logger.error("Error reading PDF: %s", e)
+        return "".join(part + "\n" for part in parts)
     
     def validate_content(self) -> bool:
         """Check if content looks like a resume.
@@ -37,55 +98,52 @@ class ResumeParser:
         if not self.text or len(self.text) < 50:
             return False
 
-        text_lower = self.text.lower()
-        
-        # Keywords typically found in resumes
-        keywords = [
-            "резюме", "cv", "образование", "опыт работы", "навыки", 
-            "skills", "education", "experience", "contacts", "контакты",
-            "телефон", "email", "почта", "гражданство", "родился", "рождения"
-        ]
-        
-        found_count = sum(1 for word in keywords if word in text_lower)
+        text_lower = self.text_lower
         
-        if found_count >= 2:
-            return True
+        # Stop scanning as soon as the second keyword is found
+        found_count = 0
+        for word in RESUME_KEYWORDS:
+            if word in text_lower:
+                found_count += 1
+                if found_count >= 2:
+                    return True
             
         # Fallback: check for year + contact
-        has_year = bool(re.search(r'\b(19|20)\d{2}\b', self.text))
+        has_year = YEAR_RE.search(self.text) is not None
         has_contact = (self.get_email() is not None) or (self.get_phone() is not None)
         
         return has_year and has_contact
 
     def get_email(self) -> str | None:
         """Find first email address."""
-        match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', self.text)
+        match = EMAIL_RE.search(self.text)
         return match.group(0) if match else None
 
     def get_phone(self) -> str | None:
         """Find phone number."""
-        pattern = r'(\+7|8)[\s\(-]*\d{3}[\s\)-]*\d{3}[\s-]*\d{2}[\s-]*\d{2}'
-        match = re.search(pattern, self.text)
+        match = PHONE_RE.search(self.text)
         return match.group(0) if match else None
 
     def get_links(self) -> str | None:
         """Find resume/portfolio links."""
-        urls = re.findall(r'https?://[^\s]+', self.text)
-        priority_domains = ['github.com', 'hh.ru', 'linkedin.com', 't.me']
-        
-        for url in urls:
-            if any(domain in url for domain in priority_domains):
+        first_url = None
+        for match in URL_RE.finditer(self.text):
+            url = match.group(0)
+            if any(domain in url for domain in PRIORITY_LINK_DOMAINS):
                 return url
+            if first_url is None:
+                first_url = url
         
-        return urls[0] if urls else None
+        return first_url
 
     def get_birth_year(self) -> str | None:
-        """Find birth year (19xx or 20xx)."""
-        matches = re.findall(r'\b(19\d{2}|20\d{2})\b', self.text)
-        valid_years = [int(y) for y in matches if 1970 <= int(y) <= 2010]
-        if valid_years:
-            return str(min(valid_years))
-        return None
+        """Find birth year (earliest 19xx or 20xx within 1970-2010)."""
+        earliest = None
+        for match in YEAR_RE.finditer(self.text):
+            year = int(match.group(0))
+            if 1970 <= year <= 2010 and (earliest is None or year < earliest):
+                earliest = year
+        return str(earliest) if earliest is not None else None
 
     def guess_name(self) -> str | None:
         """Heuristic: take first line as full name."""
@@ -102,7 +160,7 @@ class ResumeParser:
         current_year = 2025
         
         # Look for year ranges like "2021 - 2025"
-        year_matches = re.findall(r'(20\d{2})\s*[-—]\s*(20\d{2}|наст|н\.в)', self.text)
+        year_matches = YEAR_RANGE_RE.findall(self.text)
         
         for start_year, end_year_raw in year_matches:
             try:
@@ -125,25 +183,24 @@ class ResumeParser:
                 continue
 
         # Fallback: look for "N курс"
-        match = re.search(r'(\d)\s*курс', self.text, re.IGNORECASE)
+        match = COURSE_RE.search(self.text)
         if match:
             return f"{match.group(1)} курс"
         
-        if "магистратура" in self.text.lower():
+        if "магистратура" in self.text_lower:
             return "1 курс (магистратура)"
             
-        if "бакалавр" in self.text.lower() or "специалист" in self.text.lower():
+        if "бакалавр" in self.text_lower or "специалист" in self.text_lower:
             return "3 курс (бакалавриат, специалитет)"
 
         return None
 
-    def find_university(self, known_universities: list[str]) -> str | None:
+    def find_university(self, known_universities: Sequence[str]) -> str | None:
         """Find university from known list."""
-        text_lower = self.text.lower()
-        sorted_univs = sorted(known_universities, key=len, reverse=True)
+        text_lower = self.text_lower
         
-        for univ in sorted_univs:
-            if univ.lower() in text_lower:
+        for univ_lower, univ in _university_lookup(tuple(known_universities)):
+            if univ_lower in text_lower:
                 return univ
         
         # Look for abbreviations
@@ -157,14 +214,8 @@ class ResumeParser:
     
     def find_specialty(self) -> str | None:
         """Find specialty/faculty."""
-        patterns = [
-            r'Факультет[:\s]+([^\n]+)',
-            r'Специальность[:\s]+([^\n]+)',
-            r'Направление[:\s]+([^\n]+)',
-            r'Образовательная программа[:\s]+([^\n]+)'
-        ]
-        for p in patterns:
-            match = re.search(p, self.text, re.IGNORECASE)
+        for pattern in SPECIALTY_RES:
+            match = pattern.search(self.text)
             if match:
                 return match.group(1).strip()
         return None
@@ -172,7 +223,7 @@ class ResumeParser:
     def find_city(self) -> str | None:
         """Find city."""
         cities = ["Москва", "Санкт-Петербург", "Казань", "Екатеринбург", "Новосибирск"]
-        text_lower = self.text.lower()
+        text_lower = self.text_lower
         for city in cities:
             if city.lower() in text_lower:
                 return city
@@ -180,25 +231,18 @@ class ResumeParser:
 
     def find_citizenship(self) -> str | None:
         """Find citizenship."""
-        if "гражданство: рф" in self.text.lower() or "россия" in self.text.lower():
+        if "гражданство: рф" in self.text_lower or "россия" in self.text_lower:
             return "РФ"
         return None
 
     def find_tech_stack(self) -> str | None:
         """Find technologies."""
-        common_tech = [
-            "Python", "Java", "C++", "C#", "Go", "Golang", "JavaScript", "TypeScript", 
-            "React", "Vue", "Angular", "Docker", "Kubernetes", "SQL", "PostgreSQL", 
-            "MySQL", "MongoDB", "Redis", "Git", "Linux", "Bash", "CI/CD", "Django", 
-            "FastAPI", "Flask", "Spring", ".NET", "ML", "AI", "Data Science"
-        ]
-        
-        text_split = re.split(r'[\s,;]+', self.text)
-        text_tokens = set(t.strip("().,").lower() for t in text_split)
-
-        found = [tech for tech in common_tech if tech.lower() in text_tokens]
-        
-        return ", ".join(found) if found else None
+        text_tokens = {t.strip("().,") for t in TOKEN_SPLIT_RE.split(self.text_lower)}
+        found = TECH_BY_LOWER.keys() & text_tokens
+        if not found:
+            return None
+        # Keep COMMON_TECH order in the output
+        return ", ".join(TECH_BY_LOWER[t] for t in sorted(found, key=TECH_ORDER.__getitem__))
 
     def guess_priority(self, tech_stack_str: str | None) -> str | None:
         """Guess priority based on tech stack."""
@@ -220,7 +264,7 @@ class ResumeParser:
             return best
         return None
 
-    def parse_all(self, universities_list: list[str] | None = None) -> dict:
+    def parse_all(self, universities_list: Sequence[str] | None = None) -> dict:
         """Parse all data from resume.
         
         Args:
@@ -229,7 +273,7 @@ class ResumeParser:
         Returns:
             Extracted data dict.
         """
-        univ_list = universities_list or []
+        univ_list = universities_list or ()
         
         full_name = self.guess_name()
         surname, name = None, None
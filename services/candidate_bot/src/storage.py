@@ -0,0 +1,163 @@
+"""FSM storage setup."""
+
+import logging
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
+
+import msgpack
+from aiogram import BaseMiddleware
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import BaseEventIsolation, BaseStorage, StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage, SimpleEventIsolation
+from aiogram.fsm.storage.redis import DefaultKeyBuilder, RedisStorage
+from aiogram.types import TelegramObject
+
+from src.config import config
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "candidate_bot"
+
+# Tracked message IDs live next to FSM data, not inside it
+TRACKED_KEY_PART = "tracked"
+
+
+class MsgpackRedisStorage(RedisStorage):
+    """Redis FSM storage with msgpack-encoded data instead of JSON."""
+    
+    def __init__(self, *args: Any, **kwargs: Any):
+        kwargs["json_dumps"] = msgpack.packb
+        kwargs["json_loads"] = msgpack.unpackb
+        super().__init__(*args, **kwargs)
+    
+    async def get_data(self, key: StorageKey) -> dict[str, Any]:
+        """Get data (RedisStorage decodes bytes as UTF-8, msgpack is binary)."""
+        value = await self.redis.get(self.key_builder.build(key, "data"))
+        if value is None:
+            return {}
+        return msgpack.unpackb(value)
+    
+    async def append_tracked(self, key: StorageKey, message_ids: tuple[int, ...]) -> None:
+        """Append message IDs to the user's tracked list (RPUSH)."""
+        if message_ids:
+            await self.redis.rpush(self.key_builder.build(key, TRACKED_KEY_PART), *message_ids)
+    
+    async def pop_tracked(self, key: StorageKey) -> list[int]:
+        """Return and drop all tracked message IDs."""
+        redis_key = self.key_builder.build(key, TRACKED_KEY_PART)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            values, _ = await pipe.lrange(redis_key, 0, -1).delete(redis_key).execute()
+        return [int(value) for value in values]
+
+
+class TrackingMemoryStorage(MemoryStorage):
+    """In-process FSM storage with a separate tracked message list."""
+    
+    def __init__(self) -> None:
+        super().__init__()
+        self._tracked: dict[StorageKey, list[int]] = {}
+    
+    async def append_tracked(self, key: StorageKey, message_ids: tuple[int, ...]) -> None:
+        """Append message IDs to the user's tracked list."""
+        if message_ids:
+            self._tracked.setdefault(key, []).extend(message_ids)
+    
+    async def pop_tracked(self, key: StorageKey) -> list[int]:
+        """Return and drop all tracked message IDs."""
+        return self._tracked.pop(key, [])
+
+
+class CachedFSMContext(FSMContext):
+    """FSM context that reads data once and writes it back once.
+    
+    Handler reads and writes go to an in-memory copy; flush() stores
+    it if anything changed. State (not data) calls go to storage as is.
+    """
+    
+    def __init__(self, storage: BaseStorage, key: StorageKey):
+        super().__init__(storage, key)
+        self._data: dict[str, Any] | None = None
+        self._dirty = False
+    
+    async def get_data(self) -> dict[str, Any]:
+        if self._data is None:
+            self._data = await super().get_data()
+        return self._data.copy()
+    
+    async def get_value(self, key: str, default: Any | None = None) -> Any | None:
+        return (await self.get_data()).get(key, default)
+    
+    async def set_data(self, data: Mapping[str, Any]) -> None:
+        self._data = dict(data)
+        self._dirty = True
+    
+    async def update_data(
+        self,
+        data: Mapping[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        current = await self.get_data()
+        if data:
+            current.update(data)
+        current.update(kwargs)
+        await self.set_data(current)
+        return current
+    
+    async def clear(self) -> None:
+        """Reset state and data, and forget tracked messages."""
+        await super().clear()
+        await self.storage.pop_tracked(self.key)
+    
+    async def flush(self) -> None:
+        """Write cached data to storage if it was changed."""
+        if self._dirty:
+            await super().set_data(self._data)
+            self._dirty = False
+
+
+class FSMDataCacheMiddleware(BaseMiddleware):
+    """Give handlers a CachedFSMContext and flush it after the update.
+    
+    Must be registered after the built-in FSM middleware (dispatcher
+    outer middleware), so the flush happens inside the user's lock.
+    """
+    
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        state = data.get("state")
+        if state is None:
+            return await handler(event, data)
+        
+        cached = CachedFSMContext(state.storage, state.key)
+        data["state"] = cached
+        try:
+            return await handler(event, data)
+        finally:
+            await cached.flush()
+
+
+def create_storage() -> tuple[BaseStorage, BaseEventIsolation]:
+    """Create FSM storage and event isolation.
+    
+    Uses Redis when REDIS_URL is set (shared between replicas),
+    otherwise in-process memory storage. Both keep tracked message IDs
+    in their own list (append_tracked / pop_tracked), so tracking a
+    message doesn't rewrite the form data.
+    
+    Returns:
+        Tuple of (storage, events_isolation).
+    """
+    if config.redis_url:
+        logger.info("Using Redis FSM storage")
+        # Own prefix so keys don't collide with other bots on the same Redis
+        storage = MsgpackRedisStorage.from_url(
+            config.redis_url,
+            key_builder=DefaultKeyBuilder(prefix=REDIS_KEY_PREFIX),
+        )
+        return storage, storage.create_isolation()
+    
+    return TrackingMemoryStorage(), SimpleEventIsolation()
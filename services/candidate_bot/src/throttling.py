@@ -0,0 +1,67 @@
+"""Outgoing Bot API rate limiting."""
+
+import asyncio
+import logging
+import time
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+
+logger = logging.getLogger(__name__)
+
+# Telegram allows about 30 messages per second per bot
+MESSAGES_PER_SECOND = 30
+MAX_RETRIES = 3
+
+
+class ThrottlingRequestMiddleware(BaseRequestMiddleware):
+    """Keep message sends under the bot-wide limit and retry on 429.
+
+    Sends go through a token bucket, so short bursts pass without delay
+    and sustained load is smoothed instead of hitting flood control.
+    Other methods (edits, deletes, callback answers) are not delayed.
+    """
+
+    def __init__(self, rate: int = MESSAGES_PER_SECOND, max_retries: int = MAX_RETRIES):
+        self.rate = rate
+        self.max_retries = max_retries
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def _acquire(self) -> None:
+        """Wait for a free send slot."""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            await asyncio.sleep(wait)
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        if type(method).__name__.startswith(("Send", "Copy", "Forward")):
+            await self._acquire()
+
+        for attempt in range(self.max_retries):
+            try:
+                return await make_request(bot, method)
+            except TelegramRetryAfter as e:
+                if attempt == self.max_retries - 1:
+                    raise
+                logger.warning(
+                    "Flood control on %s, retry in %ss", type(method).__name__, e.retry_after
+                )
+                await asyncio.sleep(e.retry_after)
@@ -1,6 +1,10 @@
 """Ory Kratos session validation."""
 
+import copy
+import hashlib
+import time
 import uuid
+from datetime import UTC, datetime
 from typing import Any
 
 import httpx
@@ -8,6 +12,45 @@ from fastapi import HTTPException, status
 
 from app.core.config import settings
 
+# Validated sessions are reused for a short time instead of calling whoami
+SESSION_CACHE_TTL = 30.0
+SESSION_CACHE_MAX_SIZE = 1024
+
+# token hash -> (monotonic deadline, session data)
+_session_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+# Shared across requests so whoami calls reuse open TLS connections
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=5.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _client
+
+
+def _cache_lifetime(session_data: dict[str, Any]) -> float:
+    """Seconds a whoami response may be reused (0 = don't cache).
+
+    Only active sessions with a parseable expires_at are cached, and
+    never past that expiry.
+    """
+    if session_data.get("active") is not True:
+        return 0.0
+    try:
+        expires_at = datetime.fromisoformat(session_data["expires_at"])
+    except (KeyError, TypeError, ValueError):
+        return 0.0
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=UTC)
+    remaining = (expires_at - datetime.now(UTC)).total_seconds()
+    return max(0.0, min(SESSION_CACHE_TTL, remaining))
+
 
 class OryClient:
     """Client for Ory Kratos session validation."""
@@ -18,6 +61,10 @@ class OryClient:
     async def validate_session(session_token: str) -> dict[str, Any]:
         """Validate Ory session token and return session data.
 
+        Active sessions are cached in process, keyed by a hash of the token,
+        for SESSION_CACHE_TTL seconds or until the session's own expires_at,
+        whichever comes first. Callers get their own copy of the data.
+
         Args:
             session_token: The ory_session_* cookie value.
 
@@ -27,33 +74,56 @@ class OryClient:
         Raises:
             HTTPException: If session is invalid or request fails.
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    OryClient.ORY_WHOAMI_URL,
-                    headers={"Cookie": f"ory_session_infallibleshawgpsjwuc0lg={session_token}"},
-                    timeout=5.0,
-                )
-
-                if response.status_code == 401:
-                    raise HTTPException(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        detail="Invalid or expired Ory session",
-                    )
+        cache_key = hashlib.blake2b(session_token.encode(), digest_size=16).hexdigest()
+        cached = _session_cache.get(cache_key)
+        if cached and time.monotonic() < cached[0]:
+            return copy.deepcopy(cached[1])
 
-                response.raise_for_status()
-                return response.json()
+        client = _get_client()
+        try:
+            response = await client.get(
+                OryClient.ORY_WHOAMI_URL,
+                headers={"Cookie": f"ory_session_infallibleshawgpsjwuc0lg={session_token}"},
+            )
 
-            except httpx.HTTPStatusError as e:
+            if response.status_code == 401:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail=f"Ory session validation failed: {e}",
-                ) from e
-            except httpx.RequestError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail=f"Failed to connect to Ory: {e}",
-                ) from e
+                    detail="Invalid or expired Ory session",
+                )
+
+            response.raise_for_status()
+            session_data = response.json()
+
+        except httpx.HTTPStatusError as e:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=f"Ory session validation failed: {e}",
+            ) from e
+        except httpx.RequestError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"Failed to connect to Ory: {e}",
+            ) from e
+
+        lifetime = _cache_lifetime(session_data)
+        if lifetime > 0:
+            now = time.monotonic()
+            if len(_session_cache) >= SESSION_CACHE_MAX_SIZE:
+                for key in [k for k, v in _session_cache.items() if now >= v[0]]:
+                    del _session_cache[key]
+                if len(_session_cache) >= SESSION_CACHE_MAX_SIZE:
+                    _session_cache.clear()
+            _session_cache[cache_key] = (now + lifetime, session_data)
+        return copy.deepcopy(session_data)
+
+    @staticmethod
+    async def close() -> None:
+        """Close shared HTTP client (called on app shutdown)."""
+        global _client
+        if _client is not None and not _client.is_closed:
+            await _client.aclose()
+        _client = None
 
     @staticmethod
     async def get_identity_id(session_token: str) -> uuid.UUID:
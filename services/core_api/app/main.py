@@ -1,11 +1,12 @@
 """Main FastAPI application entry point."""
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from app.core.config import settings
 from app.core.exceptions import BaseAppException
+from app.core.ory_client import OryClient
 
 app = FastAPI(
     title="X5 Recruitment System API",
@@ -16,6 +17,9 @@ app = FastAPI(
     openapi_url="/api/openapi.json",
 )
 
+# Close shared Ory HTTP client on shutdown
+app.add_event_handler("shutdown", OryClient.close)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -94,8 +98,8 @@ async def clear_database() -> dict[str, str]:
                 "tracks",
             ]
 
-            for table in tables:
-                await db.execute(text(f"TRUNCATE TABLE {table} CASCADE;"))
+            # One statement, one round-trip
+            await db.execute(text(f"TRUNCATE TABLE {', '.join(tables)} CASCADE;"))
 
             # Re-enable foreign key checks
             await db.execute(text("SET session_replication_role = 'origin';"))
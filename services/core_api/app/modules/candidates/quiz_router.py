@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -239,11 +239,15 @@ async def submit_answer(
     response_model=QuizAttemptsResponse,
     status_code=status.HTTP_200_OK,
     summary="Get candidate's quiz attempts",
-    description="Get all quiz attempts for a candidate, optionally filtered by track.",
+    description=(
+        "Get quiz attempts for a candidate (newest first), "
+        "optionally filtered by track and limited in number."
+    ),
 )
 async def get_quiz_attempts(
     candidate_id: uuid.UUID,
     track_id: int | None = None,
+    limit: int | None = Query(None, ge=1, description="Max attempts to return"),
     db: AsyncSession = Depends(get_db),
 ) -> QuizAttemptsResponse:
     """Get candidate's quiz attempts.
@@ -251,13 +255,14 @@ async def get_quiz_attempts(
     Args:
         candidate_id: Candidate UUID.
         track_id: Optional track ID filter.
+        limit: Optional max number of attempts to return.
         db: Database session.
 
     Returns:
         QuizAttemptsResponse: List of quiz attempts.
     """
     sessions = await QuizSessionService.get_candidate_attempts(
-        db, candidate_id, track_id
+        db, candidate_id, track_id, limit
     )
 
     # Get track names
@@ -353,13 +353,15 @@ class QuizSessionService:
         db: AsyncSession,
         candidate_id: uuid.UUID,
         track_id: int | None = None,
+        limit: int | None = None,
     ) -> list[QuizSession]:
-        """Get candidate's quiz attempts.
+        """Get candidate's quiz attempts, newest first.
 
         Args:
             db: Database session.
             candidate_id: Candidate UUID.
             track_id: Optional track ID filter.
+            limit: Optional max number of attempts.
 
         Returns:
             list[QuizSession]: List of quiz sessions.
@@ -372,6 +374,8 @@ class QuizSessionService:
             query = query.where(QuizSession.track_id == track_id)
 
         query = query.order_by(QuizSession.started_at.desc())
+        if limit is not None:
+            query = query.limit(limit)
 
         result = await db.execute(query)
         return list(result.scalars().all())
@@ -10,9 +10,9 @@ from fastapi.responses import JSONResponse
 from src.config import config
 from src.bot import bot, dp, setup_handlers
 
-# Configure logging
+# Configure logging (unknown LOG_LEVEL falls back to INFO instead of crashing)
 logging.basicConfig(
-    level=getattr(logging, config.log_level),
+    level=logging.getLevelNamesMapping().get(config.log_level.upper(), logging.INFO),
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
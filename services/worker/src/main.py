@@ -10,9 +10,9 @@ import sys
 ENVIRONMENT = os.getenv("ENVIRONMENT", "dev")
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
-# Configure logging
+# Configure logging (unknown LOG_LEVEL falls back to INFO instead of crashing)
 logging.basicConfig(
-    level=getattr(logging, LOG_LEVEL),
+    level=logging.getLevelNamesMapping().get(LOG_LEVEL.upper(), logging.INFO),
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)